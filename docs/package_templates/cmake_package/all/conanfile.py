@@ -1,7 +1,7 @@
 from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
 from conan.tools.microsoft import check_min_vs, is_msvc_static_runtime, is_msvc
-from conan.tools.files import apply_conandata_patches, export_conandata_patches, get, copy, rm, rmdir, replace_in_file
+from conan.tools.files import apply_conandata_patches, export_conandata_patches, get, copy, rm, rmdir, replace_in_file, save
 from conan.tools.build import check_min_cppstd
 from conan.tools.scm import Version
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
@@ -30,10 +30,13 @@ class PackageConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        # link-time optimization, "thin" is only supported by clang
+        "lto": ["off", "thin", "full"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "lto": "off",
     }
 
     @property
@@ -49,6 +52,17 @@ class PackageConan(ConanFile):
             "apple-clang": "10",
         }
 
+    # static libraries built with LTO only contain intermediate code, consumers have to link them with LTO too
+    @property
+    def _lto_link_flags(self):
+        if self.options.lto == "off" or self.options.shared:
+            return []
+        if is_msvc(self):
+            return ["/LTCG"]
+        if self.settings.compiler == "gcc":
+            return ["-flto"]
+        return [f"-flto={self.options.lto}"]
+
     # no exports_sources attribute, but export_sources(self) method instead
     # this allows finer grain exportation of patches per version
     def export_sources(self):
@@ -65,6 +79,11 @@ class PackageConan(ConanFile):
         self.settings.rm_safe("compiler.libcxx")
         self.settings.rm_safe("compiler.cppstd")
 
+    def package_id(self):
+        # keep the package id of the builds without LTO
+        if self.info.options.lto == "off":
+            del self.info.options.lto
+
     def layout(self):
         # src_folder must use the same source folder name the project
         cmake_layout(self, src_folder="src")
@@ -87,6 +106,12 @@ class PackageConan(ConanFile):
         # in case it does not work in another configuration, it should validated here too
         if is_msvc(self) and self.options.shared:
             raise ConanInvalidConfiguration(f"{self.ref} can not be built as shared on Visual Studio and msvc.")
+        if self.options.lto == "thin":
+            minimum_version = {"clang": "3.9", "apple-clang": "8"}.get(str(self.settings.compiler))
+            if not minimum_version or Version(self.settings.compiler.version) < minimum_version:
+                raise ConanInvalidConfiguration(f"{self.ref} lto=thin requires clang >= 3.9 or apple-clang >= 8.")
+        elif self.options.lto == "full" and not (is_msvc(self) or self.settings.compiler in ["gcc", "clang", "apple-clang"]):
+            raise ConanInvalidConfiguration(f"{self.ref} lto=full requires gcc, clang, apple-clang or msvc.")
 
     # if another tool than the compiler or CMake is required to build the project (pkgconf, bison, flex etc)
     def build_requirements(self):
@@ -108,6 +133,15 @@ class PackageConan(ConanFile):
             tc.variables["DEPENDENCY_LIBPATH"] = self.dependencies["dependency"].cpp_info.libdirs
         # cache_variables should be used sparingly, example setting cmake policies
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0077"] = "NEW"
+        if self.options.lto != "off":
+            # CMake selects the LTO flags and archiver, CMP0069 makes old cmake_minimum_required() honor them
+            tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0069"] = "NEW"
+            tc.variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = True
+            if self.options.lto == "full" and self.settings.compiler in ["clang", "apple-clang"]:
+                # CMake uses ThinLTO with clang
+                lto_rules = os.path.join(self.generators_folder, "conan_lto_rules.cmake")
+                save(self, lto_rules, "set(CMAKE_C_COMPILE_OPTIONS_IPO -flto=full)\nset(CMAKE_CXX_COMPILE_OPTIONS_IPO -flto=full)\n")
+                tc.variables["CMAKE_USER_MAKE_RULES_OVERRIDE"] = lto_rules.replace("\\", "/")
         tc.generate()
         # In case there are dependencies listed on requirements, CMakeDeps should be used
         tc = CMakeDeps(self)
@@ -159,6 +193,8 @@ class PackageConan(ConanFile):
             self.cpp_info.system_libs.append("m")
             self.cpp_info.system_libs.append("pthread")
             self.cpp_info.system_libs.append("dl")
+        self.cpp_info.sharedlinkflags = self._lto_link_flags
+        self.cpp_info.exelinkflags = self._lto_link_flags
 
         # TODO: to remove in conan v2 once cmake_find_package_* generators removed
         self.cpp_info.filenames["cmake_find_package"] = "PACKAGE"
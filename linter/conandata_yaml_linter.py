@@ -1,4 +1,4 @@
-import argparse
+"""Validate Conan's 'conandata.yaml' file to ConanCenterIndex's requirements."""
 from strictyaml import (
     load,
     Map,
@@ -10,45 +10,39 @@ from strictyaml import (
     Enum,
     Any,
 )
-from yaml_linting import file_path
+from yaml_linting import main
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Validate Conan's 'conandata.yaml' file to ConanCenterIndex's requirements."
-    )
-    parser.add_argument(
-        "path",
-        nargs="?",
-        type=file_path,
-        help="file to validate.",
-    )
-    args = parser.parse_args()
+# Built once per interpreter, each worker of the pool reuses it for all its files
+patch_fields = Map(
+    {
+        "patch_file": Str(),
+        "patch_description": Str(),
+        "patch_type": Enum(
+            ["official", "conan", "portability", "bugfix", "vulnerability"]
+        ),
+        Optional("patch_source"): Str(),
+        Optional("sha256"): Str(),  # Really uncommon
+        # No longer required for v2 recipes with layouts
+        Optional("base_path"): Str(),
+    }
+)
+schema = Map(
+    {
+        "sources": MapPattern(Str(), Any(), minimum_keys=1),
+        Optional("patches"): MapPattern(Str(), Seq(patch_fields), minimum_keys=1),
+    }
+)
 
-    patch_fields = Map(
-        {
-            "patch_file": Str(),
-            "patch_description": Str(),
-            "patch_type": Enum(
-                ["official", "conan", "portability", "bugfix", "vulnerability"]
-            ),
-            Optional("patch_source"): Str(),
-            Optional("sha256"): Str(),  # Really uncommon
-            # No longer required for v2 recipes with layouts
-            Optional("base_path"): Str(),
-        }
-    )
-    schema = Map(
-        {
-            "sources": MapPattern(Str(), Any(), minimum_keys=1),
-            Optional("patches"): MapPattern(Str(), Seq(patch_fields), minimum_keys=1),
-        }
-    )
 
-    with open(args.path) as f:
-        content = f.read()
+def validate(path):
+    """Validate a single conandata.yml, returning the GitHub annotations as a string"""
+    messages = []
 
     try:
+        with open(path) as f:
+            content = f.read()
+
         parsed = load(content, schema)
 
         if "patches" in parsed:
@@ -60,23 +54,25 @@ def main():
                         type in ["official", "bugfix", "vulnerability"]
                         and not "patch_source" in patch
                     ):
-                        print(
-                            f"::warning file={args.path},line={type.start_line},endline={type.end_line},"
+                        messages.append(
+                            f"::warning file={path},line={type.start_line},endline={type.end_line},"
                             f"title=conandata.yml schema warning"
                             "::'patch_type' should have 'patch_source' as per https://github.com/conan-io/conan-center-index/blob/master/docs/conandata_yml_format.md#patches-fields"
                             " it is expected to have a source (e.g. a URL) to where it originates from to help with reviewing and consumers to evaluate patches\n"
                         )
     except YAMLValidationError as error:
         e = error.__str__().replace("\n", "%0A")
-        print(
-            f"::error file={args.path},line={error.context_mark.line},endline={error.problem_mark.line},"
+        messages.append(
+            f"::error file={path},line={error.context_mark.line},endline={error.problem_mark.line},"
             f"title=conandata.yml schema error"
             f"::{e}\n"
         )
     except BaseException as error:
         e = error.__str__().replace("\n", "%0A")
-        print(f"::error ::{e}")
+        messages.append(f"::error ::{e}")
+
+    return "\n".join(messages)
 
 
 if __name__ == "__main__":
-    main()
+    main(validate)
@@ -0,0 +1,269 @@
+"""
+Apply the Conan v2 import and name rules of the pylint plugins using only the stdlib 'ast' module.
+
+The checks in this folder only look at 'from ... import ...' statements and at the 'name' attribute
+of the ConanFile class, so they do not need astroid's inference nor the Conan modules loaded by
+transform_conanfile.py. This runner reproduces the messages pylint emits for them (same texts,
+locations and JSON layout) and lints the files in parallel:
+
+    python linter/conanv2_import_linter.py --output-format=json recipes/*/*/conanfile.py
+
+The message definitions are read from the 'msgs' attribute of the pylint checkers, which remain
+the reference implementation.
+"""
+
+import argparse
+import ast
+import os
+import re
+import sys
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+
+from message_format import format_messages
+from yaml_linting import file_path, default_jobs
+
+
+CHECKER_MODULES = [
+    "check_package_name.py",
+    "check_no_test_package_name.py",
+    "check_import_conanfile.py",
+    "check_import_errors.py",
+    "check_import_tools.py",
+]
+MESSAGE_TYPES = {"E": "error", "W": "warning", "R": "refactor", "C": "convention", "F": "fatal", "I": "info"}
+PRAGMA = re.compile(r"#\s*pylint\s*:\s*(disable-next|disable|enable|skip-file)\s*(?:=\s*([\w\-, ]+))?")
+
+
+def _load_message_definitions():
+    """Map each message symbol to its (message-id, text) from the pylint checkers' sources"""
+    linter_folder = os.path.dirname(os.path.abspath(__file__))
+    definitions = {}
+    for filename in CHECKER_MODULES:
+        with open(os.path.join(linter_folder, filename)) as f:
+            tree = ast.parse(f.read(), filename)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Assign) and \
+               any(isinstance(target, ast.Name) and target.id == "msgs" for target in node.targets):
+                for msgid, (text, symbol, _) in ast.literal_eval(node.value).items():
+                    definitions[symbol] = (msgid, text)
+    return definitions
+
+
+MESSAGES = _load_message_definitions()
+
+
+class ConanV2ImportVisitor:
+    """
+       Same rules as the pylint checkers, over a stdlib 'ast' tree
+    """
+
+    def __init__(self, module, test_package):
+        self.module = module
+        self.test_package = test_package
+        self.frames = []
+        self.messages = []
+
+    def add_message(self, symbol, node, line=None, col_offset=None, end_lineno=None, end_col_offset=None):
+        msgid, text = MESSAGES[symbol]
+        self.messages.append({
+            "type": MESSAGE_TYPES[msgid[0]],
+            "module": self.module,
+            "obj": ".".join(self.frames),
+            "line": line or node.lineno,
+            "column": col_offset if col_offset is not None else node.col_offset,
+            "endLine": end_lineno or node.end_lineno,
+            "endColumn": end_col_offset if end_col_offset is not None else node.end_col_offset,
+            "path": None,
+            "symbol": symbol,
+            "message": text,
+            "message-id": msgid,
+        })
+
+    def visit(self, node):
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            # Messages on a class or function belong to its own frame, like in pylint
+            self.frames.append(getattr(node, "name", "<lambda>"))
+            self._visit_node(node)
+            for child in ast.iter_child_nodes(node):
+                self.visit(child)
+            self.frames.pop()
+        else:
+            self._visit_node(node)
+            for child in ast.iter_child_nodes(node):
+                self.visit(child)
+
+    def _visit_node(self, node):
+        if isinstance(node, ast.ClassDef):
+            self.visit_classdef(node)
+        elif isinstance(node, ast.ImportFrom):
+            self.visit_importfrom(node)
+
+    def visit_classdef(self, node):
+        if len(node.bases) != 1 or not isinstance(node.bases[0], ast.Name) or node.bases[0].id != "ConanFile":
+            return
+        for attr in node.body:
+            if isinstance(attr, ast.Assign) and len(attr.targets) == 1 and \
+               isinstance(attr.targets[0], ast.Name) and \
+               attr.targets[0].id == "name" and \
+               isinstance(attr.value, ast.Constant):
+                if self.test_package:
+                    self.add_message("conan-test-no-name", node=attr)
+                    continue
+                value = repr(attr.value.value)
+                if value.lower() != value:
+                    self.add_message("conan-bad-name", node=attr)
+                return
+        if not self.test_package:
+            # pylint reports a class on its 'class Name' span
+            self.add_message("conan-missing-name", node=node, end_lineno=node.lineno,
+                             end_col_offset=node.col_offset + len("class ") + len(node.name))
+
+    def visit_importfrom(self, node):
+        basename = node.module or ""
+        names = [alias.name for alias in node.names]
+        if basename == "conans" and "ConanFile" in names:
+            self.add_message("conan-import-conanfile", node=node)
+        if basename == "conans" and "errors" in names:
+            self.add_message("conan-import-errors", node=node)
+        if basename == "conans.errors" and "ConanException" in names:
+            self.add_message("conan-import-error-conanexception", node=node)
+        if basename == "conans.errors" and "ConanInvalidConfiguration" in names:
+            self.add_message("conan-import-error-conaninvalidconfiguration", node=node)
+        if basename == "conan" and "tools" in names:
+            self.add_message("conan-import-tools", node=node)
+        elif re.match(r"conan\.tools\.[^.]+\..+", basename):
+            self.add_message("conan-import-tools", node=node)
+
+
+def _disabled_ranges(content, tree):
+    """
+       Line ranges of the '# pylint: disable=...' comments, or None when the whole file is skipped.
+
+       Like in pylint, a comment on its own line disables the messages until the end of the enclosing
+       module, class or function, one on a 'class' or 'def' line covers its whole body, and any other
+       one covers its own line only. 'disable-next' covers the following line, and 'enable' removes
+       its messages from the ranges it overlaps, with the same scope as 'disable'.
+    """
+    scopes = [(node.lineno, node.end_lineno) for node in ast.walk(tree)
+              if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))]
+    module_end = len(content.splitlines()) or 1
+    disabled = []
+    for token in tokenize.generate_tokens(iter(content.splitlines(keepends=True)).__next__):
+        if token.type != tokenize.COMMENT:
+            continue
+        match = PRAGMA.search(token.string)
+        if not match:
+            continue
+        if match.group(1) == "skip-file":
+            return None
+        line = token.start[0]
+        names = {name.strip() for name in (match.group(2) or "").split(",") if name.strip()}
+        if match.group(1) == "disable-next":
+            disabled.append((line + 1, line + 1, names))
+            continue
+        if token.line[:token.start[1]].strip():
+            # Trailing comment, of a 'class' or 'def' line or of a single statement
+            end = max((end for start, end in scopes if start == line), default=line)
+        else:
+            end = min((end for start, end in scopes if start <= line <= end), default=module_end)
+        if match.group(1) == "disable":
+            disabled.append((line, end, names))
+            continue
+        # enable: split the overlapping ranges, without the enabled messages from line to end
+        ranges = []
+        for start, stop, disabled_names in disabled:
+            if stop < line or start > end:
+                ranges.append((start, stop, disabled_names))
+                continue
+            if start < line:
+                ranges.append((start, line - 1, disabled_names))
+            remaining = set() if "all" in names else disabled_names - names
+            if remaining:
+                ranges.append((max(start, line), min(stop, end), remaining))
+            if stop > end:
+                ranges.append((end + 1, stop, disabled_names))
+        disabled = ranges
+    return disabled
+
+
+def lint(path, test_package=False):
+    """Lint a single conanfile, returning its messages with pylint's JSON layout"""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+
+    module = os.path.splitext(os.path.basename(path))[0]
+    display_path = os.path.abspath(path).replace(os.getcwd() + os.sep, "", 1)
+
+    try:
+        tree = ast.parse(content, path)
+        disabled = _disabled_ranges(content, tree)
+    except (SyntaxError, tokenize.TokenError) as error:
+        return [{
+            "type": "error",
+            "module": module,
+            "obj": "",
+            "line": getattr(error, "lineno", None) or 1,
+            "column": 0,
+            "endLine": None,
+            "endColumn": None,
+            "path": display_path,
+            "symbol": "syntax-error",
+            "message": f"Parsing failed: '{error.msg if isinstance(error, SyntaxError) else error} ({module}, line {getattr(error, 'lineno', 1)})'",
+            "message-id": "E0001",
+        }]
+    if disabled is None:
+        return []
+
+    visitor = ConanV2ImportVisitor(module, test_package)
+    visitor.visit(tree)
+
+    messages = []
+    for msg in visitor.messages:
+        pragmas = set().union(*(names for start, end, names in disabled if start <= msg["line"] <= end))
+        if not pragmas.intersection({"all", msg["symbol"], msg["message-id"]}):
+            messages.append({**msg, "path": display_path})
+    return messages
+
+
+def _lint_recipe(path):
+    return lint(path)
+
+
+def _lint_test_package(path):
+    return lint(path, test_package=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check Conan v2 imports (E9006, E9008-E9011) and recipe names (E9004, E9005, E9007) without pylint."
+    )
+    parser.add_argument("path", nargs="+", type=file_path, help="conanfiles to lint.")
+    parser.add_argument("--test-package", action="store_true",
+                        help="apply the test_package rules (as linter/pylintrc_testpackage does).")
+    parser.add_argument("--output-format", choices=["text", "parseable", "json"], default="text")
+    parser.add_argument("--output", help="write the report to this file instead of stdout.")
+    parser.add_argument("-j", "--jobs", type=int, default=default_jobs(),
+                        help="number of worker processes used when linting several files.")
+    args = parser.parse_args()
+
+    task = _lint_test_package if args.test_package else _lint_recipe
+    if len(args.path) == 1 or args.jobs <= 1:
+        results = list(map(task, args.path))
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            results = list(executor.map(task, args.path, chunksize=32))
+    messages = [msg for result in results for msg in result]
+
+    report = format_messages(messages, args.output_format)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    elif report:
+        print(report)
+
+    sys.exit(2 if messages else 0)
+
+
+if __name__ == "__main__":
+    main()
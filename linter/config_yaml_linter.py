@@ -1,37 +1,44 @@
-import argparse
+"""Validate ConanCenterIndex's 'config.yaml' file."""
+import os
 from strictyaml import load, Map, Str, YAMLValidationError, MapPattern
-from yaml_linting import file_path
-
-
-def main():
-    parser = argparse.ArgumentParser(
-        description="Validate ConanCenterIndex's 'config.yaml' file."
-    )
-    parser.add_argument(
-        "path",
-        nargs="?",
-        type=file_path,
-        help="file to validate.",
-    )
-    args = parser.parse_args()
-
-    schema = Map(
-        {"versions": MapPattern(Str(), Map({"folder": Str()}), minimum_keys=1)}
-    )
-
-    with open(args.path) as f:
+from yaml_linting import main
+
+
+# Built once per interpreter, each worker of the pool reuses it for all its files
+schema = Map(
+    {"versions": MapPattern(Str(), Map({"folder": Str()}), minimum_keys=1)}
+)
+
+
+def validate(path):
+    """Validate a single config.yml, returning the GitHub annotations as a string"""
+    messages = []
+
+    with open(path) as f:
         content = f.read()
 
     try:
-        load(content, schema)
+        parsed = load(content, schema)
+
+        recipe_folder = os.path.dirname(path)
+        for version in parsed["versions"]:
+            folder = parsed["versions"][version]["folder"]
+            if not os.path.isdir(os.path.join(recipe_folder, folder.data)):
+                messages.append(
+                    f"::error file={path},line={folder.start_line},endline={folder.end_line},"
+                    f"title=config.yml schema error"
+                    f"::folder '{folder.data}' of version '{version}' does not exist in '{recipe_folder}'\n"
+                )
     except YAMLValidationError as error:
         e = error.__str__().replace("\n", "%0A")
-        print(
-            f"::error file={args.path},line={error.context_mark.line},endline={error.problem_mark.line},"
+        messages.append(
+            f"::error file={path},line={error.context_mark.line},endline={error.problem_mark.line},"
             f"title=config.yml schema error"
             f"::{e}\n"
         )
 
+    return "\n".join(messages)
+
 
 if __name__ == "__main__":
-    main()
+    main(validate)
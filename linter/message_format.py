@@ -0,0 +1,14 @@
+import json
+
+
+def format_messages(messages, output_format):
+    """Render pylint-like message dictionaries the same way pylint's reporters do"""
+    if output_format == "json":
+        return json.dumps(messages, indent=4)
+    lines = []
+    for msg in messages:
+        if output_format == "parseable":
+            lines.append(f"{msg['path']}:{msg['line']}: [{msg['message-id']}({msg['symbol']}), {msg['obj']}] {msg['message']}")
+        else:
+            lines.append(f"{msg['path']}:{msg['line']}:{msg['column']}: {msg['message-id']}: {msg['message']} ({msg['symbol']})")
+    return "\n".join(lines)
@@ -0,0 +1,203 @@
+"""
+Run pylint over conanfiles, replaying stored results for the files that did not change.
+
+Messages are cached per file on disk. The key is the hash of the file contents together
+with a hash of everything else that can change the result: the linter plugins in this
+folder, the rcfile, the extra pylint arguments and the versions of pylint, astroid and conan.
+Only the files with no cached result are linted, all in a single pylint run.
+
+The 'duplicate-code' check compares files with each other, so it cannot be cached per
+file and it is always disabled here.
+
+    python linter/pylint_cache.py --rcfile=linter/pylintrc_recipe recipes/*/*/conanfile.py
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from configparser import ConfigParser
+
+from pylint.lint import Run
+from pylint.reporters import BaseReporter
+from message_format import format_messages
+from yaml_linting import file_path
+
+
+CACHE_VERSION = "1"
+DEFAULT_EVALUATION = "0 if fatal else 10.0 - ((float(5 * error + warning + refactor + convention) / statement) * 10)"
+# Checks whose result depend on more than one file
+CROSS_FILE_CHECKS = ["duplicate-code"]
+MESSAGE_CATEGORIES = ["fatal", "error", "warning", "refactor", "convention", "info"]
+# Same values as pylint's exit status bits
+MESSAGE_STATUS = {"fatal": 1, "error": 2, "warning": 4, "refactor": 8, "convention": 16}
+
+
+class CollectingReporter(BaseReporter):
+    """
+       Keep the messages and the number of statements of each linted file
+    """
+
+    name = "cci-cache"
+
+    def __init__(self):
+        super().__init__()
+        self.results = {}
+        self._current = None
+
+    def handle_message(self, msg):
+        self.results.setdefault(msg.abspath, {"statement": 0, "messages": []})["messages"].append({
+            "type": msg.category,
+            "module": msg.module,
+            "obj": msg.obj,
+            "line": msg.line,
+            "column": msg.column,
+            "endLine": msg.end_line,
+            "endColumn": msg.end_column,
+            "path": None,
+            "symbol": msg.symbol,
+            "message": msg.msg or "",
+            "message-id": msg.msg_id,
+        })
+
+    def _store_statements(self):
+        # pylint resets the module statistics right after calling on_set_current_module
+        if self._current is not None:
+            module, filepath = self._current
+            result = self.results.setdefault(os.path.abspath(filepath), {"statement": 0, "messages": []})
+            result["statement"] = self.linter.stats.by_module.get(module, {}).get("statement", 0)
+
+    def on_set_current_module(self, module, filepath):
+        self._store_statements()
+        self._current = (module, filepath) if filepath else None
+
+    def on_close(self, stats, previous_stats):
+        self._store_statements()
+        self._current = None
+
+    def _display(self, layout):
+        pass
+
+
+def _hash_file(path, hasher=None):
+    hasher = hasher or hashlib.sha256()
+    with open(path, "rb") as f:
+        hasher.update(f.read())
+    return hasher
+
+
+def _package_version(name):
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return ""
+
+
+def linter_hash(rcfile, pylint_args):
+    """Hash of everything but the linted file that may change pylint's output"""
+    hasher = hashlib.sha256(CACHE_VERSION.encode())
+    linter_folder = os.path.dirname(os.path.abspath(__file__))
+    for filename in sorted(os.listdir(linter_folder)):
+        if filename.endswith(".py"):
+            hasher.update(filename.encode())
+            _hash_file(os.path.join(linter_folder, filename), hasher)
+    _hash_file(rcfile, hasher)
+    for item in [sys.version, *map(_package_version, ["pylint", "astroid", "conan"]), *pylint_args]:
+        hasher.update(item.encode())
+    return hasher.hexdigest()
+
+
+def _cache_path(cache_dir, key):
+    return os.path.join(cache_dir, key[:2], f"{key}.json")
+
+
+def _load(cache_dir, key):
+    try:
+        with open(_cache_path(cache_dir, key)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save(cache_dir, key, result):
+    path = _cache_path(cache_dir, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write and rename, so a concurrent run never reads a partial file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(result, f)
+    os.replace(tmp_path, path)
+
+
+def _evaluation(rcfile):
+    config = ConfigParser(inline_comment_prefixes=("#",))
+    config.read(rcfile)
+    return config.get("REPORTS", "evaluation", fallback=DEFAULT_EVALUATION)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run pylint over recipes, reusing cached results of unchanged files. "
+                    "Unknown arguments are forwarded to pylint."
+    )
+    parser.add_argument("--rcfile", type=file_path, required=True, help="pylint rcfile to use.")
+    parser.add_argument("--cache-dir", default=".pylint_cache", help="folder where results are stored.")
+    parser.add_argument("--output-format", choices=["text", "parseable", "json"], default="text")
+    parser.add_argument("--output", help="write the report to this file instead of stdout.")
+    parser.add_argument("--fail-under", type=float, help="fail when the score is below this value.")
+    parser.add_argument("--score", choices=["y", "n"], default="n", help="display the score.")
+    parser.add_argument("path", nargs="+", type=file_path, help="files to lint.")
+    args, pylint_args = parser.parse_known_args()
+    pylint_args.append(f"--disable={','.join(CROSS_FILE_CHECKS)}")
+
+    base_hash = linter_hash(args.rcfile, pylint_args)
+    keys = {path: _hash_file(path, hashlib.sha256(base_hash.encode())).hexdigest() for path in args.path}
+    results = {path: _load(args.cache_dir, key) for path, key in keys.items()}
+
+    missing = [path for path, result in results.items() if result is None]
+    if missing:
+        reporter = CollectingReporter()
+        Run([f"--rcfile={args.rcfile}", *pylint_args, *missing], reporter=reporter, exit=False)
+        for path in missing:
+            result = reporter.results.get(os.path.abspath(path), {"statement": 0, "messages": []})
+            _save(args.cache_dir, keys[path], result)
+            results[path] = result
+
+    messages = []
+    stats = dict.fromkeys(MESSAGE_CATEGORIES + ["statement"], 0)
+    for path in args.path:
+        stats["statement"] += results[path]["statement"]
+        for msg in results[path]["messages"]:
+            messages.append({**msg, "path": path})
+            stats[msg["type"]] += 1
+
+    report = format_messages(messages, args.output_format)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    elif report:
+        print(report)
+
+    print(f"{len(args.path) - len(missing)} cached, {len(missing)} linted", file=sys.stderr)
+
+    status = 0
+    for category, bit in MESSAGE_STATUS.items():
+        if stats[category]:
+            status |= bit
+
+    score = None
+    if stats["statement"]:
+        score = eval(_evaluation(args.rcfile), {}, stats)  # pylint: disable=eval-used
+        if args.score == "y" or args.fail_under is not None:
+            print(f"Your code has been rated at {score:.2f}/10", file=sys.stderr)
+
+    if args.fail_under is not None and score is not None:
+        sys.exit(0 if score >= args.fail_under else (status or 1))
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,72 +1,96 @@
-
 # Class ConanFile doesn't declare all the valid members and functions,
 #   some are injected by Conan dynamically to the class.
 
+import functools
 import textwrap
 import astroid
 from astroid.builder import AstroidBuilder
 from astroid.manager import AstroidManager
 
 
-def _settings_transform():
-    module = AstroidBuilder(AstroidManager()).string_build(
-        textwrap.dedent("""
-            class Settings(object):
-                os = None
-                arch = None
-                compiler = None
-                build_type = None
-            """)
-    )
-    return module['Settings']
-
-def _user_info_build_transform():
-    module = AstroidBuilder(AstroidManager()).string_build(
-        textwrap.dedent("""
-            class UserInfoBuild(defaultdict):
-                pass
-            """)
-    )
-    return module['UserInfoBuild']
+# Stand-ins for the classes Conan injects into ConanFile. Building them from this string is much
+# cheaper than having astroid load 'conans.model.info', 'conans.client.graph.graph_manager', ...
+# and everything they import. Recipes use many members of these objects that pylint can't see,
+# so most of them accept any attribute, item or call.
+_CONANFILE_STUBS = textwrap.dedent("""
+    class Settings(object):
+        os = None
+        arch = None
+        compiler = None
+        build_type = None
+
+    class UserInfoBuild(defaultdict):
+        pass
+
+    class _DynamicMembers(object):
+        def __getattr__(self, name):
+            return _DynamicMembers()
+
+        def __getitem__(self, key):
+            return _DynamicMembers()
+
+        def __call__(self, *args, **kwargs):
+            return _DynamicMembers()
+
+    class ConanInfo(_DynamicMembers):
+        pass
+
+    class RecipeBuildRequires(_DynamicMembers):
+        pass
+
+    class FileCopier(_DynamicMembers):
+        pass
+
+    class FileImporter(_DynamicMembers):
+        pass
+
+    class PyRequires(_DynamicMembers):
+        pass
+
+    class Conf(_DynamicMembers):
+        pass
+    """)
 
 
 def register(_):
     pass
 
+
+@functools.lru_cache(maxsize=None)
+def _dynamic_fields():
+    """Types of the dynamic fields, built once per process"""
+    module = AstroidBuilder(AstroidManager()).string_build(_CONANFILE_STUBS, modname="_conanfile_stubs")
+
+    def instance(name):
+        return module[name].instantiate_class()
+
+    str_class = astroid.builtin_lookup("str")[1][0]
+    dict_class = astroid.builtin_lookup("dict")[1][0]
+    info = instance("ConanInfo")
+    build_requires = instance("RecipeBuildRequires")
+
+    return {
+        "conan_data": [dict_class.instantiate_class()],
+        "build_requires": [build_requires],
+        "tool_requires": [build_requires],
+        "info_build": [info],
+        "user_info_build": [module["UserInfoBuild"]],
+        "info": [info],
+        "copy": [instance("FileCopier")],
+        "copy_deps": [instance("FileImporter")],
+        "python_requires": [instance("PyRequires")],
+        "recipe_folder": [str_class.instantiate_class()],
+        "settings_build": [module["Settings"]],
+        "settings_target": [module["Settings"]],
+        "conf": [instance("Conf")],
+    }
+
+
 def transform_conanfile(node):
     """Transform definition of ConanFile class so dynamic fields are visible to pylint"""
 
-    str_class = astroid.builtin_lookup("str")
-    dict_class = astroid.builtin_lookup("dict")
-    info_class = astroid.MANAGER.ast_from_module_name("conans.model.info").lookup(
-        "ConanInfo")
-    build_requires_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.graph.graph_manager").lookup("_RecipeBuildRequires")
-    file_copier_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.file_copier").lookup("FileCopier")
-    file_importer_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.importer").lookup("_FileImporter")
-    python_requires_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.graph.python_requires").lookup("PyRequires")
-
-    dynamic_fields = {
-        "conan_data": str_class,
-        "build_requires": build_requires_class,
-        "tool_requires": build_requires_class,
-        "info_build": info_class,
-        "user_info_build": [_user_info_build_transform()],
-        "info": info_class,
-        "copy": file_copier_class,
-        "copy_deps": file_importer_class,
-        "python_requires": [str_class, python_requires_class],
-        "recipe_folder": str_class,
-        "settings_build": [_settings_transform()],
-        "settings_target": [_settings_transform()],
-        "conf": dict_class,
-    }
-    
-    for f, t in dynamic_fields.items():
-        node.locals[f] = [i for i in t]
+    for f, t in _dynamic_fields().items():
+        node.locals[f] = list(t)
 
 
 astroid.MANAGER.register_transform(
@@ -1,4 +1,8 @@
 import argparse
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
 
 def file_path(a_string):
@@ -7,3 +11,53 @@ def file_path(a_string):
     if not isfile(a_string):
         raise argparse.ArgumentTypeError(f"{a_string} does not point to a file")
     return a_string
+
+
+def file_paths(patterns):
+    """Expand every path or glob pattern into a sorted, de-duplicated list of files"""
+    files = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern) if glob.has_magic(pattern) else [pattern]
+        if not matches:
+            raise argparse.ArgumentTypeError(f"{pattern} does not match any file")
+        files.update(file_path(match) for match in matches)
+    return sorted(files)
+
+
+def default_jobs():
+    return os.cpu_count() or 1
+
+
+def report(results):
+    for output in results:
+        if output:
+            print(output)
+
+
+def main(validate):
+    """Command line entry point of a linter, validate maps a file path to its GitHub annotations"""
+    parser = argparse.ArgumentParser(description=sys.modules[validate.__module__].__doc__)
+    parser.add_argument(
+        "path",
+        nargs="+",
+        help="files or glob patterns to validate (e.g. 'recipes/*/config.yml' or 'recipes/*/*/conandata.yml').",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        help="number of worker processes used when validating several files.",
+    )
+    args = parser.parse_args()
+
+    try:
+        paths = file_paths(args.path)
+    except argparse.ArgumentTypeError as error:
+        parser.error(str(error))
+
+    if len(paths) == 1 or args.jobs <= 1:
+        report(map(validate, paths))
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            report(executor.map(validate, paths, chunksize=32))
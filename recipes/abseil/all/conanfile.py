@@ -25,14 +25,50 @@ class AbseilConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "with_sse42": [True, False],
+        "with_aes": [True, False],
+        "with_pclmul": [True, False],
+        "with_arm_crypto": [True, False],
+        "lto": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "with_sse42": False,
+        "with_aes": False,
+        "with_pclmul": False,
+        "with_arm_crypto": False,
+        "lto": False,
     }
 
     short_paths = True
 
+    @property
+    def _is_x86(self):
+        return self.settings.arch in ["x86", "x86_64"]
+
+    @property
+    def _is_armv8(self):
+        return str(self.settings.arch).startswith("armv8")
+
+    @property
+    def _hardware_flags(self):
+        # Instructions every abseil library may use, not only the runtime-dispatched randen_hwaes
+        flags = []
+        if self.options.get_safe("with_sse42"):
+            flags.append("-msse4.2")
+        if self.options.get_safe("with_aes"):
+            flags.append("-maes")
+        if self.options.get_safe("with_pclmul"):
+            flags.append("-mpclmul")
+        if self.options.get_safe("with_arm_crypto"):
+            # Extend the architecture of the profile (the last -march wins), armv8-a by default
+            profile_march = [flag for flag in self.conf.get("tools.build:cxxflags", default=[], check_type=list)
+                             if flag.startswith("-march=")]
+            march = profile_march[-1] if profile_march else "-march=armv8-a"
+            flags.append(march if "+crypto" in march else f"{march}+crypto")
+        return flags
+
     def export_sources(self):
         copy(self, "abi_trick/*", self.recipe_folder, self.export_sources_folder)
         for p in self.conan_data.get("patches", {}).get(self.version, []):
@@ -41,11 +77,23 @@ class AbseilConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        # msvc compiles these intrinsics without any flag
+        if not self._is_x86 or is_msvc(self):
+            del self.options.with_sse42
+            del self.options.with_aes
+            del self.options.with_pclmul
+        if not self._is_armv8 or is_msvc(self):
+            del self.options.with_arm_crypto
 
     def configure(self):
         if self.options.shared:
             del self.options.fPIC
 
+    def package_id(self):
+        # Keep the package id of the builds without LTO
+        if not self.info.options.lto:
+            del self.info.options.lto
+
     def validate(self):
         if self.info.settings.compiler.cppstd:
             check_min_cppstd(self, 11)
@@ -70,6 +118,12 @@ class AbseilConan(ConanFile):
         if is_msvc(self):
             # see https://github.com/abseil/abseil-cpp/issues/649
             tc.preprocessor_definitions["_HAS_DEPRECATED_RESULT_OF"] = 1
+        if self.options.lto:
+            # The absl_* targets get CMake's LTO flags, CMP0069=NEW for the LTS releases requiring CMake 3.5
+            tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0069"] = "NEW"
+            tc.variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = True
+        # Appended to the flags of the profile rather than replacing them
+        tc.extra_cxxflags.extend(self._hardware_flags)
         tc.generate()
 
     def _patch_sources(self):
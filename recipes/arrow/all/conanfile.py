@@ -46,8 +46,9 @@ class ArrowConan(ConanFile):
         "with_gflags": ["auto", True, False],
         "with_glog": ["auto", True, False],
         "with_grpc": ["auto", True, False],
-        "with_jemalloc": ["auto", True, False],
-        "with_mimalloc": ["auto", True, False],
+        "allocator": ["system", "jemalloc", "mimalloc"],
+        "with_jemalloc": ["auto", True, False, "deprecated"],
+        "with_mimalloc": ["auto", True, False, "deprecated"],
         "with_json": [True, False],
         "with_llvm": ["auto", True, False],
         "with_openssl": ["auto", True, False],
@@ -91,8 +92,9 @@ class ArrowConan(ConanFile):
         "with_flight_sql": False,
         "with_gcs": False,
         "with_gflags": "auto",
-        "with_jemalloc": "auto",
-        "with_mimalloc": False,
+        "allocator": "system",
+        "with_jemalloc": "deprecated",
+        "with_mimalloc": "deprecated",
         "with_glog": "auto",
         "with_grpc": "auto",
         "with_json": False,
@@ -144,10 +146,22 @@ class ArrowConan(ConanFile):
             del self.options.with_opentelemetry
         if Version(self.version) < "8.0.0":
             del self.options.substrait
+        if "BSD" in str(self.settings.os):
+            self.options.allocator = "jemalloc"
 
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if self.options.with_jemalloc != "deprecated" or self.options.with_mimalloc != "deprecated":
+            self.output.warn("with_jemalloc and with_mimalloc options are deprecated, use allocator option instead.")
+            if self.options.with_mimalloc not in ["deprecated", False]:
+                self.options.allocator = "mimalloc"
+            if self.options.with_jemalloc not in ["deprecated", "auto", False]:
+                self.options.allocator = "jemalloc"
+            elif self.options.with_jemalloc == False and self.options.allocator == "jemalloc":
+                self.options.allocator = "system"
+        self.options.rm_safe("with_jemalloc")
+        self.options.rm_safe("with_mimalloc")
 
     def validate(self):
         if self.info.settings.compiler.cppstd:
@@ -175,8 +189,8 @@ class ArrowConan(ConanFile):
             raise ConanInvalidConfiguration("dataset_modules options is required (or choose auto)")
         if self.options.get_safe("skyhook", False):
             raise ConanInvalidConfiguration("CCI has no librados recipe (yet)")
-        if self.options.with_jemalloc == False and self._with_jemalloc(True):
-            raise ConanInvalidConfiguration("with_jemalloc option is required (or choose auto)")
+        if self.options.allocator != "jemalloc" and "BSD" in str(self.settings.os):
+            raise ConanInvalidConfiguration(f"{self.ref} requires allocator=jemalloc on {self.settings.os}")
         if self.options.with_re2 == False and self._with_re2(True):
             raise ConanInvalidConfiguration("with_re2 option is required (or choose auto)")
         if self.options.with_protobuf == False and self._with_protobuf(True):
@@ -200,7 +214,7 @@ class ArrowConan(ConanFile):
         if self.options.with_s3 and not self.options["aws-sdk-cpp"].config:
             raise ConanInvalidConfiguration("arrow:with_s3 requires aws-sdk-cpp:config is True.")
 
-        if self.options.shared and self._with_jemalloc():
+        if self.options.shared and self.options.allocator == "jemalloc":
             if self.options["jemalloc"].enable_cxx:
                 raise ConanInvalidConfiguration("jemmalloc.enable_cxx of a static jemalloc must be disabled")
 
@@ -228,12 +242,6 @@ class ArrowConan(ConanFile):
         else:
             return bool(self.options.dataset_modules)
 
-    def _with_jemalloc(self, required=False):
-        if required or self.options.with_jemalloc == "auto":
-            return bool("BSD" in str(self.settings.os))
-        else:
-            return bool(self.options.with_jemalloc)
-
     def _with_re2(self, required=False):
         if required or self.options.with_re2 == "auto":
             if self.options.gandiva or self.options.parquet:
@@ -323,10 +331,11 @@ class ArrowConan(ConanFile):
             self.requires("thrift/0.17.0")
         if self._with_protobuf():
             self.requires("protobuf/3.21.4")
-        if self._with_jemalloc():
+        if self.options.allocator == "jemalloc":
             self.requires("jemalloc/5.3.0")
-        if self.options.with_mimalloc:
-            self.requires("mimalloc/1.7.6")
+        elif self.options.allocator == "mimalloc":
+            # Only the memory pool uses it, replacing malloc (mimalloc:override) is left to the consumers
+            self.requires("mimalloc/2.0.7")
         if self._with_boost():
             self.requires("boost/1.80.0")
         if self._with_gflags():
@@ -409,8 +418,9 @@ class ArrowConan(ConanFile):
         tc.variables["ARROW_COMPUTE"] = self._compute()
         tc.variables["ARROW_CSV"] = bool(self.options.with_csv)
         tc.variables["ARROW_CUDA"] = bool(self.options.with_cuda)
-        tc.variables["ARROW_JEMALLOC"] = self._with_jemalloc()
-        tc.variables["ARROW_MIMALLOC"] = bool(self.options.with_mimalloc)
+        # The memory pool of the allocator is the default one of arrow::default_memory_pool()
+        tc.variables["ARROW_JEMALLOC"] = self.options.allocator == "jemalloc"
+        tc.variables["ARROW_MIMALLOC"] = self.options.allocator == "mimalloc"
         tc.variables["ARROW_JSON"] = bool(self.options.with_json)
         tc.variables["google_cloud_cpp_SOURCE"] = "SYSTEM"
         tc.variables["ARROW_GCS"] = bool(self.options.get_safe("with_gcs", False))
@@ -543,11 +553,14 @@ class ArrowConan(ConanFile):
         self.info.options.with_gflags = self._with_gflags()
         self.info.options.with_protobuf = self._with_protobuf()
         self.info.options.with_re2 = self._with_re2()
-        self.info.options.with_jemalloc = self._with_jemalloc()
         self.info.options.with_openssl = self._with_openssl()
         self.info.options.with_boost = self._with_boost()
         self.info.options.with_glog = self._with_glog()
         self.info.options.with_grpc = self._with_grpc()
+        # Keep the package id of the builds made with the with_jemalloc and with_mimalloc options
+        self.info.options.with_jemalloc = self.options.allocator == "jemalloc"
+        self.info.options.with_mimalloc = self.options.allocator == "mimalloc"
+        del self.info.options.allocator
 
     def package_info(self):
         self.cpp_info.filenames["cmake_find_package"] = "Arrow"
@@ -630,9 +643,9 @@ class ArrowConan(ConanFile):
             self.cpp_info.components["libarrow"].requires.append("gflags::gflags")
         if self._with_glog():
             self.cpp_info.components["libarrow"].requires.append("glog::glog")
-        if self._with_jemalloc():
+        if self.options.allocator == "jemalloc":
             self.cpp_info.components["libarrow"].requires.append("jemalloc::jemalloc")
-        if self.options.with_mimalloc:
+        elif self.options.allocator == "mimalloc":
             self.cpp_info.components["libarrow"].requires.append("mimalloc::mimalloc")
         if self._with_re2():
             self.cpp_info.components["libgandiva"].requires.append("re2::re2")
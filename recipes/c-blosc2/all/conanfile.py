@@ -22,7 +22,8 @@ class CBlosc2Conan(ConanFile):
         "fPIC": [True, False],
         "simd_intrinsics": [None, "sse2", "avx2"],
         "with_lz4": [True, False],
-        "with_zlib": [None, "zlib", "zlib-ng", "zlib-ng-compat"],
+        "with_deflate_backend": [None, "zlib", "zlib-ng-native", "zlib-ng-compat"],
+        "with_zlib": [None, "zlib", "zlib-ng", "zlib-ng-compat", "deprecated"],
         "with_zstd": [True, False],
         "with_plugins": [True, False],
     }
@@ -31,7 +32,8 @@ class CBlosc2Conan(ConanFile):
         "fPIC": True,
         "simd_intrinsics": "avx2",
         "with_lz4": True,
-        "with_zlib": "zlib",
+        "with_deflate_backend": "zlib",
+        "with_zlib": "deprecated",
         "with_zstd": True,
         "with_plugins": True,
     }
@@ -60,10 +62,17 @@ class CBlosc2Conan(ConanFile):
         except Exception:
             pass
 
+        if self.options.with_zlib != "deprecated":
+            self.output.warn("with_zlib option is deprecated, use with_deflate_backend option instead.")
+            with_zlib = str(self.options.with_zlib)
+            # Native zlib-ng, "zlib-ng" is zlib with its zlib-ng backend in the other with_deflate_backend options
+            self.options.with_deflate_backend = "zlib-ng-native" if with_zlib == "zlib-ng" else with_zlib
+        del self.options.with_zlib
+
         # c-blosc2 uses zlib-ng with zlib compat options.
-        if self.options.with_zlib == "zlib-ng-compat":
+        if self.options.with_deflate_backend == "zlib-ng-compat":
             self.options["zlib-ng"].zlib_compat = True
-        elif self.options.with_zlib == "zlib-ng":
+        elif self.options.with_deflate_backend == "zlib-ng-native":
             self.options["zlib-ng"].zlib_compat = False
 
     def layout(self):
@@ -72,9 +81,9 @@ class CBlosc2Conan(ConanFile):
     def requirements(self):
         if self.options.with_lz4:
             self.requires("lz4/1.9.4")
-        if self.options.with_zlib in ["zlib-ng", "zlib-ng-compat"]:
+        if self.options.with_deflate_backend in ["zlib-ng-native", "zlib-ng-compat"]:
             self.requires("zlib-ng/2.0.6")
-        elif self.options.with_zlib == "zlib":
+        elif self.options.with_deflate_backend == "zlib":
             self.requires("zlib/1.2.13")
         if self.options.with_zstd:
             self.requires("zstd/1.5.2")
@@ -112,12 +121,12 @@ class CBlosc2Conan(ConanFile):
         tc.cache_variables["DEACTIVATE_AVX2"] = simd_intrinsics != "avx2"
         tc.cache_variables["DEACTIVATE_LZ4"] = not bool(self.options.with_lz4)
         tc.cache_variables["PREFER_EXTERNAL_LZ4"] = True
-        tc.cache_variables["DEACTIVATE_ZLIB"] = self.options.with_zlib is None
+        tc.cache_variables["DEACTIVATE_ZLIB"] = not bool(self.options.with_deflate_backend)
         tc.cache_variables["PREFER_EXTERNAL_ZLIB"] = True
         tc.cache_variables["DEACTIVATE_ZSTD"] = not bool(self.options.with_zstd)
         tc.cache_variables["PREFER_EXTERNAL_ZSTD"] = True
         tc.cache_variables["BUILD_PLUGINS"] = bool(self.options.with_plugins)
-        if self.options.with_zlib == "zlib-ng-compat":
+        if self.options.with_deflate_backend == "zlib-ng-compat":
             tc.preprocessor_definitions["ZLIB_COMPAT"] = "1"
         tc.generate()
 
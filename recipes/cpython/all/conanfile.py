@@ -21,6 +21,7 @@ class CPythonConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "optimizations": [True, False],
+        "profile_task": [None, "ANY"],
         "lto": [True, False],
         "docstrings": [True, False],
         "pymalloc": [True, False],
@@ -44,6 +45,7 @@ class CPythonConan(ConanFile):
         "shared": False,
         "fPIC": True,
         "optimizations": False,
+        "profile_task": None,
         "lto": False,
         "docstrings": True,
         "pymalloc": True,
@@ -122,6 +124,9 @@ class CPythonConan(ConanFile):
     def configure(self):
         if self.options.shared:
             del self.options.fPIC
+        if not self.options.optimizations:
+            # Training workload of the profile-guided optimization
+            del self.options.profile_task
         if not self._supports_modules:
                 del self.options.with_bz2
                 del self.options.with_sqlite3
@@ -161,6 +166,9 @@ class CPythonConan(ConanFile):
 
     def package_id(self):
         del self.info.options.env_vars
+        if self.options.optimizations and not self.options.profile_task:
+            # Keep the package id of the builds training with the default workload
+            del self.info.options.profile_task
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version],
@@ -425,7 +433,11 @@ class CPythonConan(ConanFile):
             self._msvc_build()
         else:
             autotools = self._configure_autotools()
-            autotools.make()
+            args = []
+            if self.options.get_safe("profile_task"):
+                # Arguments of the instrumented interpreter, instead of the default "-m test --pgo"
+                args.append("PROFILE_TASK={}".format(self.options.profile_task))
+            autotools.make(args=args)
 
     @property
     def _msvc_artifacts_path(self):
@@ -35,6 +35,7 @@ class DuckdbConan(ConanFile):
         "with_shell": [True, False],
         "with_threads": [True, False],
         "with_rdtsc": [True, False],
+        "allocator": ["system", "jemalloc", "mimalloc"],
     }
     default_options = {
         "shared": False,
@@ -54,6 +55,7 @@ class DuckdbConan(ConanFile):
         "with_shell": False,
         "with_threads": True,
         "with_rdtsc": False,
+        "allocator": "system",
     }
     short_paths = True
 
@@ -71,6 +73,14 @@ class DuckdbConan(ConanFile):
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if self.options.allocator == "mimalloc":
+            # Linked by the consumers, replaces malloc for the whole process
+            self.options["mimalloc"].override = True
+
+    def package_id(self):
+        # Keep the package id of the builds with the system allocator
+        if self.info.options.allocator == "system":
+            del self.info.options.allocator
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -81,6 +91,10 @@ class DuckdbConan(ConanFile):
             self.requires("odbc/2.3.11")
         if self.options.with_httpfs:
             self.requires("openssl/3.0.7")
+        if self.options.allocator == "jemalloc":
+            self.requires("jemalloc/5.3.0")
+        elif self.options.allocator == "mimalloc":
+            self.requires("mimalloc/2.0.7")
 
     def validate(self):
         if self.info.settings.compiler.cppstd:
@@ -24,6 +24,7 @@ class FmtConan(ConanFile):
         "fPIC": [True, False],
         "with_fmt_alias": [True, False],
         "with_os_api": [True, False],
+        "lto": [True, False],
     }
     default_options = {
         "header_only": False,
@@ -31,6 +32,7 @@ class FmtConan(ConanFile):
         "fPIC": True,
         "with_fmt_alias": False,
         "with_os_api": True,
+        "lto": False,
     }
 
     @property
@@ -49,6 +51,10 @@ class FmtConan(ConanFile):
             tc.cache_variables["FMT_LIB_DIR"] = "lib"
             if self._has_with_os_api_option:
                 tc.cache_variables["FMT_OS"] = bool(self.options.with_os_api)
+            if self.options.lto:
+                # Older fmt releases declare a CMake minimum below 3.9, where CMP0069 ignores the IPO variable
+                tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0069"] = "NEW"
+                tc.variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = True
             tc.generate()
 
     def layout(self):
@@ -72,6 +78,7 @@ class FmtConan(ConanFile):
             except Exception:
                 pass
             del self.options.shared
+            del self.options.lto
             try:
                 del self.options.with_os_api
             except Exception:
@@ -87,6 +94,9 @@ class FmtConan(ConanFile):
             self.info.clear()
         else:
             del self.info.options.with_fmt_alias
+            # Keep the package id of the builds without LTO
+            if not self.info.options.lto:
+                del self.info.options.lto
 
     def validate(self):
         if self.info.settings.get_safe("compiler.cppstd"):
@@ -33,6 +33,10 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": [True, False],
         "enable_libdl": [True, False],
         "enable_prof": [True, False],
+        "enable_prof_libunwind": [True, False],
+        "lg_page": [None, "ANY"],
+        "lg_quantum": [None, "ANY"],
+        "malloc_conf": [None, "ANY"],
     }
     default_options = {
         "shared": False,
@@ -48,6 +52,10 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": True,
         "enable_libdl": True,
         "enable_prof": False,
+        "enable_prof_libunwind": False,
+        "lg_page": None,
+        "lg_quantum": None,
+        "malloc_conf": None,
     }
     exports_sources = ["patches/**"]
 
@@ -63,6 +71,23 @@ class JemallocConan(ConanFile):
         if not self.options.enable_cxx:
             del self.settings.compiler.libcxx
             del self.settings.compiler.cppstd
+        if not self.options.enable_prof:
+            del self.options.enable_prof_libunwind
+
+    def package_id(self):
+        # Keep the package id of the builds without the options added later
+        if not self.options.get_safe("enable_prof_libunwind", True):
+            del self.info.options.enable_prof_libunwind
+        if not self.options.lg_page:
+            del self.info.options.lg_page
+        if not self.options.lg_quantum:
+            del self.info.options.lg_quantum
+        if not self.options.malloc_conf:
+            del self.info.options.malloc_conf
+
+    def requirements(self):
+        if self.options.get_safe("enable_prof_libunwind"):
+            self.requires("libunwind/1.6.2")
 
     def validate(self):
         if self.options.enable_cxx and \
@@ -85,6 +110,13 @@ class JemallocConan(ConanFile):
             raise ConanInvalidConfiguration("Unsupported compiler version")
         if self.settings.os == "Macos" and self.settings.arch not in ("x86_64", "x86"):
             raise ConanInvalidConfiguration("Unsupported arch")
+        if self.options.get_safe("enable_prof_libunwind") and self.settings.os not in ("Linux", "FreeBSD"):
+            raise ConanInvalidConfiguration("enable_prof_libunwind is only supported on Linux and FreeBSD")
+        # Base 2 logarithms of the page size (e.g. 16 for 64 KiB pages) and of the allocation alignment
+        for option in ("lg_page", "lg_quantum"):
+            value = self.options.get_safe(option)
+            if value and not str(value).isdigit():
+                raise ConanInvalidConfiguration("{} must be a positive integer, not '{}'".format(option, value))
 
     def layout(self):
         basic_layout(self, src_folder="src")
@@ -117,6 +149,15 @@ class JemallocConan(ConanFile):
         ]
         if self.options.enable_prof:
             conf_args.append("--enable-prof")
+            if self.options.enable_prof_libunwind:
+                conf_args.append("--enable-prof-libunwind")
+        if self.options.lg_page:
+            conf_args.append("--with-lg-page={}".format(self.options.lg_page))
+        if self.options.lg_quantum:
+            conf_args.append("--with-lg-quantum={}".format(self.options.lg_quantum))
+        if self.options.malloc_conf:
+            # Built-in default of the MALLOC_CONF settings, e.g. background_thread:true,dirty_decay_ms:5000
+            conf_args.append("--with-malloc-conf={}".format(self.options.malloc_conf))
         if self.options.shared:
             conf_args.extend(["--enable-shared", "--disable-static"])
         else:
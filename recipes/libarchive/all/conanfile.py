@@ -22,6 +22,7 @@ class LibarchiveConan(ConanFile):
         "fPIC": [True, False],
         "with_acl": [True, False],
         "with_zlib": [True, False],
+        "with_deflate_backend": ["zlib", "zlib-ng"],
         "with_bzip2": [True, False],
         "with_libxml2": [True, False],
         "with_expat": [True, False],
@@ -43,6 +44,7 @@ class LibarchiveConan(ConanFile):
         "fPIC": True,
         "with_acl": True,
         "with_zlib": True,
+        "with_deflate_backend": "zlib",
         "with_bzip2": False,
         "with_libxml2": False,
         "with_expat": False,
@@ -74,6 +76,11 @@ class LibarchiveConan(ConanFile):
             self.options.rm_safe("fPIC")
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
+        if not self.options.with_zlib:
+            self.options.rm_safe("with_deflate_backend")
+        elif self.options.with_deflate_backend == "zlib-ng":
+            # zlib built as a zlib-ng wrapper, in compat mode
+            self.options["zlib"].backend = "zlib-ng"
 
     def requirements(self):
         if self.options.with_zlib:
@@ -25,7 +25,8 @@ class Nghttp2Conan(ConanFile):
         "fPIC": [True, False],
         "with_app": [True, False],
         "with_hpack": [True, False],
-        "with_jemalloc": [True, False],
+        "allocator": ["system", "jemalloc", "mimalloc"],
+        "with_jemalloc": [True, False, "deprecated"],
         "with_asio": [True, False],
     }
     default_options = {
@@ -33,7 +34,8 @@ class Nghttp2Conan(ConanFile):
         "fPIC": True,
         "with_app": False,
         "with_hpack": False,
-        "with_jemalloc": False,
+        "allocator": "system",
+        "with_jemalloc": "deprecated",
         "with_asio": False,
     }
 
@@ -59,8 +61,16 @@ class Nghttp2Conan(ConanFile):
                 del self.settings.compiler.libcxx
             except Exception:
                 pass
+        if self.options.with_jemalloc != "deprecated":
+            self.output.warn("with_jemalloc option is deprecated, use allocator option instead.")
+            if self.options.with_jemalloc:
+                self.options.allocator = "jemalloc"
+        del self.options.with_jemalloc
+        # The library takes custom allocators at runtime (nghttp2_mem), only the applications are linked to one
         if not self.options.with_app:
-            del self.options.with_jemalloc
+            del self.options.allocator
+        elif self.options.allocator == "mimalloc":
+            self.options["mimalloc"].override = True
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -74,8 +84,10 @@ class Nghttp2Conan(ConanFile):
             self.requires("libevent/2.1.12")
             self.requires("libxml2/2.9.14")
             self.requires("zlib/1.2.13")
-            if self.options.with_jemalloc:
+            if self.options.allocator == "jemalloc":
                 self.requires("jemalloc/5.3.0")
+            elif self.options.allocator == "mimalloc":
+                self.requires("mimalloc/2.0.7")
         if self.options.with_hpack:
             self.requires("jansson/2.14")
         if self.options.with_asio:
@@ -102,7 +114,7 @@ class Nghttp2Conan(ConanFile):
         tc.variables["ENABLE_FAILMALLOC"] = False
         # disable unneeded auto-picked dependencies
         tc.variables["WITH_LIBXML2"] = False
-        tc.variables["WITH_JEMALLOC"] = self.options.get_safe("with_jemalloc", False)
+        tc.variables["WITH_JEMALLOC"] = self.options.get_safe("allocator") == "jemalloc"
         tc.variables["WITH_SPDYLAY"] = False
         tc.variables["ENABLE_ASIO_LIB"] = self.options.with_asio
         if Version(self.version) >= "1.42.0":
@@ -128,13 +140,19 @@ class Nghttp2Conan(ConanFile):
                        "${CMAKE_CURRENT_SOURCE_DIR}/includes)\n",
                        append=True)
         target_libnghttp2 = "nghttp2" if self.options.shared else "nghttp2_static"
+        find_allocator, app_libs = "", target_libnghttp2
+        if self.options.get_safe("allocator") == "mimalloc":
+            # jemalloc has WITH_JEMALLOC, mimalloc replaces malloc by being linked to the applications
+            find_allocator = "find_package(mimalloc REQUIRED CONFIG)\n"
+            app_libs += " mimalloc" if self.dependencies["mimalloc"].options.shared else " mimalloc-static"
         replace_in_file(self, os.path.join(self.source_folder, "src", "CMakeLists.txt"),
                               "\n"
                               "link_libraries(\n"
                               "  nghttp2\n",
                               "\n"
+                              "{}"
                               "link_libraries(\n"
-                              "  {} ${{CONAN_LIBS}}\n".format(target_libnghttp2))
+                              "  {} ${{CONAN_LIBS}}\n".format(find_allocator, app_libs))
         if not self.options.shared:
             replace_in_file(self, os.path.join(self.source_folder, "src", "CMakeLists.txt"),
                                   "\n"
@@ -181,8 +199,10 @@ class Nghttp2Conan(ConanFile):
                 "openssl::openssl", "c-ares::c-ares", "libev::libev",
                 "libevent::libevent", "libxml2::libxml2", "zlib::zlib",
             ]
-            if self.options.with_jemalloc:
+            if self.options.allocator == "jemalloc":
                 self.cpp_info.components["nghttp2_app"].requires.append("jemalloc::jemalloc")
+            elif self.options.allocator == "mimalloc":
+                self.cpp_info.components["nghttp2_app"].requires.append("mimalloc::mimalloc")
 
         if self.options.with_hpack:
             self.cpp_info.components["nghttp2_hpack"].requires = ["jansson::jansson"]
@@ -27,6 +27,7 @@ class LibpngConan(ConanFile):
         "sse": [True, False],
         "vsx": [True, False],
         "api_prefix": ["ANY"],
+        "with_deflate_backend": ["zlib", "zlib-ng"],
     }
     default_options = {
         "shared": False,
@@ -36,6 +37,7 @@ class LibpngConan(ConanFile):
         "sse": True,
         "vsx": True,
         "api_prefix": "",
+        "with_deflate_backend": "zlib",
     }
 
     @property
@@ -74,6 +76,9 @@ class LibpngConan(ConanFile):
             self.options.rm_safe("fPIC")
         self.settings.rm_safe("compiler.libcxx")
         self.settings.rm_safe("compiler.cppstd")
+        if self.options.with_deflate_backend == "zlib-ng":
+            # zlib built as a zlib-ng wrapper, in compat mode
+            self.options["zlib"].backend = "zlib-ng"
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -24,7 +24,8 @@ class LibtiffConan(ConanFile):
         "lzma": [True, False],
         "jpeg": [False, "libjpeg-turbo", "libjpeg"],
         "zlib": [True, False],
-        "libdeflate": [True, False],
+        "with_deflate_backend": ["zlib", "zlib-ng", "libdeflate"],
+        "libdeflate": [True, False, "deprecated"],
         "zstd": [True, False],
         "jbig": [True, False],
         "webp": [True, False],
@@ -36,7 +37,8 @@ class LibtiffConan(ConanFile):
         "lzma": True,
         "jpeg": "libjpeg",
         "zlib": True,
-        "libdeflate": True,
+        "with_deflate_backend": "libdeflate",
+        "libdeflate": "deprecated",
         "zstd": True,
         "jbig": True,
         "webp": True,
@@ -55,6 +57,11 @@ class LibtiffConan(ConanFile):
     def _has_libdeflate_option(self):
         return Version(self.version) >= "4.2.0"
 
+    @property
+    def _with_libdeflate(self):
+        # libtiff uses libdeflate for whole strips and tiles, and zlib for the rest
+        return self.options.get_safe("with_deflate_backend") == "libdeflate"
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -67,6 +74,7 @@ class LibtiffConan(ConanFile):
             del self.options.zstd
         if not self._has_libdeflate_option:
             del self.options.libdeflate
+            self.options.with_deflate_backend = "zlib"
 
     def configure(self):
         if self.options.shared:
@@ -74,6 +82,15 @@ class LibtiffConan(ConanFile):
         if not self.options.cxx:
             self.settings.rm_safe("compiler.cppstd")
             self.settings.rm_safe("compiler.libcxx")
+        if self.options.get_safe("libdeflate", "deprecated") != "deprecated":
+            self.output.warn("libdeflate option is deprecated, use with_deflate_backend option instead.")
+            self.options.with_deflate_backend = "libdeflate" if self.options.libdeflate else "zlib"
+        self.options.rm_safe("libdeflate")
+        if not self.options.zlib and self.options.with_deflate_backend != "libdeflate":
+            self.options.rm_safe("with_deflate_backend")
+        elif self.options.with_deflate_backend == "zlib-ng":
+            # zlib built as a zlib-ng wrapper, in compat mode
+            self.options["zlib"].backend = "zlib-ng"
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -81,7 +98,7 @@ class LibtiffConan(ConanFile):
     def requirements(self):
         if self.options.zlib:
             self.requires("zlib/1.2.13")
-        if self.options.get_safe("libdeflate"):
+        if self._with_libdeflate:
             self.requires("libdeflate/1.15")
         if self.options.lzma:
             self.requires("xz_utils/5.2.5")
@@ -97,8 +114,10 @@ class LibtiffConan(ConanFile):
             self.requires("libwebp/1.2.4")
 
     def validate(self):
-        if self.options.get_safe("libdeflate") and not self.options.zlib:
-            raise ConanInvalidConfiguration("libtiff:libdeflate=True requires libtiff:zlib=True")
+        if self.options.get_safe("with_deflate_backend") == "libdeflate" and not self._has_libdeflate_option:
+            raise ConanInvalidConfiguration(f"{self.ref} can't use libdeflate, it requires libtiff 4.2.0 or later")
+        if self._with_libdeflate and not self.options.zlib:
+            raise ConanInvalidConfiguration("libtiff:with_deflate_backend=libdeflate requires libtiff:zlib=True")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version],
@@ -112,7 +131,7 @@ class LibtiffConan(ConanFile):
         tc.variables["jbig"] = self.options.jbig
         tc.variables["zlib"] = self.options.zlib
         if self._has_libdeflate_option:
-            tc.variables["libdeflate"] = self.options.libdeflate
+            tc.variables["libdeflate"] = self._with_libdeflate
         if self._has_zstd_option:
             tc.variables["zstd"] = self.options.zstd
         if self._has_webp_option:
@@ -15,6 +15,13 @@ class LibunifexConan(ConanFile):
     topics = ("async", "cpp")
 
     settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "with_liburing": [True, False],
+    }
+    default_options = {
+        # Opt-in, io_uring_context needs a recent kernel
+        "with_liburing": False,
+    }
 
     generators = "cmake", "cmake_find_package_multi"
     no_copy_source = True
@@ -37,11 +44,18 @@ class LibunifexConan(ConanFile):
     def _minimum_standard(self):
         return "17"
 
-    # FIXME: Add support for liburing
-    # def requirements(self):
-        # TODO: Make an option to opt-out of liburing for old kernel versions
-        # if self.settings.os == "Linux":
-        #    self.requires("liburing/2.1")
+    def config_options(self):
+        if self.settings.os != "Linux":
+            del self.options.with_liburing
+
+    def package_id(self):
+        # Keep the package id of the builds without liburing
+        if self.options.get_safe("with_liburing") == False:
+            del self.info.options.with_liburing
+
+    def requirements(self):
+        if self.options.get_safe("with_liburing"):
+            self.requires("liburing/2.2")
 
     def validate(self):
         if self.settings.compiler.get_safe("cppstd"):
@@ -73,6 +87,8 @@ class LibunifexConan(ConanFile):
     def _configure_cmake(self):
         cmake = CMake(self)
         cmake.definitions["BUILD_TESTING"] = "OFF"
+        # unifex::io_uring_context is built when FindLibUring.cmake finds liburing, never look for the one of the system
+        cmake.definitions["CMAKE_DISABLE_FIND_PACKAGE_LibUring"] = not self.options.get_safe("with_liburing", False)
         cmake.configure()
         return cmake
 
@@ -106,5 +122,5 @@ class LibunifexConan(ConanFile):
 
         if self.settings.os == "Linux":
             self.cpp_info.components["unifex"].system_libs = ["pthread"]
-        #    self.cpp_info.components["unifex"].requires.append(
-        #        "liburing::liburing")
+        if self.options.get_safe("with_liburing"):
+            self.cpp_info.components["unifex"].requires.append("liburing::liburing")
@@ -21,10 +21,16 @@ class LZ4Conan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "tools": [True, False],
+        "fast_dec_loop": [None, True, False],
+        "force_memory_access": [None, "memcpy", "packed", "direct"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "tools": False,
+        "fast_dec_loop": None,
+        "force_memory_access": None,
     }
 
     def export_sources(self):
@@ -47,6 +53,15 @@ class LZ4Conan(ConanFile):
         except Exception:
             pass
 
+    def package_id(self):
+        # Keep the package id of the builds using the default values of these options
+        if not self.options.tools:
+            del self.info.options.tools
+        if self.options.fast_dec_loop == "None":
+            del self.info.options.fast_dec_loop
+        if not self.options.force_memory_access:
+            del self.info.options.force_memory_access
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
@@ -56,10 +71,16 @@ class LZ4Conan(ConanFile):
 
     def generate(self):
         tc = CMakeToolchain(self)
-        tc.variables["LZ4_BUILD_CLI"] = False
+        tc.variables["LZ4_BUILD_CLI"] = self.options.tools
         tc.variables["LZ4_BUILD_LEGACY_LZ4C"] = False
         tc.variables["LZ4_BUNDLED_MODE"] = False
         tc.variables["LZ4_POSITION_INDEPENDENT_LIB"] = self.options.get_safe("fPIC", True)
+        # Tuning macros of lz4.c, left to its own detection by default
+        if self.options.fast_dec_loop != "None":
+            tc.preprocessor_definitions["LZ4_FAST_DEC_LOOP"] = 1 if self.options.fast_dec_loop else 0
+        if self.options.force_memory_access:
+            memory_access = {"memcpy": 0, "packed": 1, "direct": 2}
+            tc.preprocessor_definitions["LZ4_FORCE_MEMORY_ACCESS"] = memory_access[str(self.options.force_memory_access)]
         # Generate a relocatable shared lib on Macos
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0042"] = "NEW"
         # Honor BUILD_SHARED_LIBS (see https://github.com/conan-io/conan/issues/11840)
@@ -122,6 +143,10 @@ class LZ4Conan(ConanFile):
         self.cpp_info.libs = ["lz4"]
         if is_msvc(self) and self.options.shared:
             self.cpp_info.defines.append("LZ4_DLL_IMPORT=1")
+        if self.options.tools:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info(f"Appending PATH environment variable: {bin_path}")
+            self.env_info.PATH.append(bin_path)
 
         # TODO: to remove in conan v2 once legacy generators removed
         self.cpp_info.build_modules["cmake_find_package"] = [self._module_file_rel_path]
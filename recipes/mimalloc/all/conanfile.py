@@ -28,6 +28,9 @@ class MimallocConan(ConanFile):
         "override": [True, False],
         "inject": [True, False],
         "single_object": [True, False],
+        "stat": [True, False],
+        "padding": [True, False],
+        "debug_full": [True, False],
     }
     default_options = {
         "shared": False,
@@ -36,6 +39,9 @@ class MimallocConan(ConanFile):
         "override": False,
         "inject": False,
         "single_object": False,
+        "stat": False,
+        "padding": True,
+        "debug_full": False,
     }
 
 
@@ -65,6 +71,14 @@ class MimallocConan(ConanFile):
             del self.options.single_object
             del self.options.inject
 
+        # MI_PADDING is a CMake option of every version in conandata, 1.6.7 onwards
+        if Version(self.version) < "1.6.7":
+            del self.options.padding
+
+        # Full heap invariant checking of the debug builds
+        if self.settings.build_type != "Debug":
+            del self.options.debug_full
+
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
@@ -83,6 +97,15 @@ class MimallocConan(ConanFile):
             self.options.rm_safe("single_object")
             self.options.rm_safe("inject")
 
+    def package_id(self):
+        # Keep the package id of the builds without the options added later
+        if not self.info.options.stat:
+            del self.info.options.stat
+        if self.info.options.get_safe("padding", True):
+            self.info.options.rm_safe("padding")
+        if not self.info.options.get_safe("debug_full"):
+            self.info.options.rm_safe("debug_full")
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
@@ -130,6 +153,13 @@ class MimallocConan(ConanFile):
         tc.variables["MI_BUILD_OBJECT"] = self.options.get_safe("single_object", False)
         tc.variables["MI_OVERRIDE"] = "ON" if self.options.override else "OFF"
         tc.variables["MI_SECURE"] = "ON" if self.options.secure else "OFF"
+        if self.options.get_safe("padding") is not None:
+            # Canary bytes after each block, to detect heap block overflows in the secure and debug builds
+            tc.variables["MI_PADDING"] = "ON" if self.options.padding else "OFF"
+        tc.variables["MI_DEBUG_FULL"] = "ON" if self.options.get_safe("debug_full") else "OFF"
+        if self.options.stat:
+            # Detailed statistics in release builds too, printed at exit with MIMALLOC_SHOW_STATS=1
+            tc.preprocessor_definitions["MI_STAT"] = 2
         if Version(self.version) >= "1.7.0":
             tc.variables["MI_INSTALL_TOPLEVEL"] = "ON"
         tc.generate()
@@ -223,37 +253,64 @@ class MimallocConan(ConanFile):
             name += "-{}".format(str(self.settings.build_type).lower())
         return name
 
+    @property
+    def _preload_library(self):
+        """Shared library overriding malloc when preloaded, None if the package has none"""
+        if not (self.options.shared and self.options.override) or self.settings.os == "Windows":
+            return None
+        extension = "dylib" if self.settings.os == "Macos" else "so"
+        return os.path.join(self.package_folder, "lib", "{}.{}".format(self._lib_name, extension))
+
     def package_info(self):
         self.cpp_info.set_property("cmake_file_name", "mimalloc")
         self.cpp_info.set_property("cmake_target_name", "mimalloc" if self.options.shared else "mimalloc-static")
 
         self.cpp_info.names["cmake_find_package"] = "mimalloc"
         self.cpp_info.names["cmake_find_package_multi"] = "mimalloc"
-        self.cpp_info.builddirs.append(self._module_subfolder)
-        self.cpp_info.build_modules["cmake_find_package"] = [self._module_file_rel_path]
-        self.cpp_info.build_modules["cmake_find_package_multi"] = [self._module_file_rel_path]
+
+        cpp_info = self.cpp_info
+        preload_library = self._preload_library
+        if preload_library:
+            # The root target links both the library and the preload component
+            cpp_info = self.cpp_info.components["libmimalloc"]
+            cpp_info.set_property("cmake_target_name", "mimalloc::libmimalloc")
+
+            # Nothing to link: run unmodified binaries with LD_PRELOAD=$MIMALLOC_PRELOAD_LIBRARY
+            # (DYLD_INSERT_LIBRARIES on Macos) to replace their allocator
+            preload = self.cpp_info.components["preload"]
+            preload.set_property("cmake_target_name", "mimalloc::preload")
+            preload.includedirs = []
+            preload.libdirs = []
+            preload.resdirs = []
+            preload.bindirs = []
+            self.runenv_info.define_path("MIMALLOC_PRELOAD_LIBRARY", preload_library)
+            self.env_info.MIMALLOC_PRELOAD_LIBRARY = preload_library
+
+        cpp_info.builddirs.append(self._module_subfolder)
+        cpp_info.build_modules["cmake_find_package"] = [self._module_file_rel_path]
+        cpp_info.build_modules["cmake_find_package_multi"] = [self._module_file_rel_path]
 
         if self.options.get_safe("inject"):
-            self.cpp_info.includedirs = []
-            self.cpp_info.libdirs = []
-            self.cpp_info.resdirs = []
+            cpp_info.includedirs = []
+            cpp_info.libdirs = []
+            cpp_info.resdirs = []
             return
 
         if self.options.get_safe("single_object"):
             obj_ext = "o"
             obj_file = "{}.{}".format(self._obj_name, obj_ext)
             obj_path = os.path.join(self.package_folder, "lib", obj_file)
-            self.cpp_info.exelinkflags = [obj_path]
-            self.cpp_info.sharedlinkflags = [obj_path]
-            self.cpp_info.libdirs = []
-            self.cpp_info.bindirs = []
+            cpp_info.exelinkflags = [obj_path]
+            cpp_info.sharedlinkflags = [obj_path]
+            cpp_info.libdirs = []
+            cpp_info.bindirs = []
         else:
-            self.cpp_info.libs = collect_libs(self)
+            cpp_info.libs = collect_libs(self)
 
         if self.settings.os == "Linux":
-            self.cpp_info.system_libs.append("pthread")
+            cpp_info.system_libs.append("pthread")
         if not self.options.shared:
             if self.settings.os == "Windows":
-                self.cpp_info.system_libs.extend(["psapi", "shell32", "user32", "bcrypt"])
+                cpp_info.system_libs.extend(["psapi", "shell32", "user32", "bcrypt"])
             elif self.settings.os == "Linux":
-                self.cpp_info.system_libs.append("rt")
+                cpp_info.system_libs.append("rt")
@@ -28,6 +28,7 @@ class MongoCDriverConan(ConanFile):
         "with_sasl": [False, "sspi", "cyrus"],
         "with_snappy": [True, False],
         "with_zlib": [True, False],
+        "with_deflate_backend": ["zlib", "zlib-ng"],
         "with_zstd": [True, False],
         "with_icu": [True, False],
         "srv": [True, False],
@@ -39,6 +40,7 @@ class MongoCDriverConan(ConanFile):
         "with_sasl": False,
         "with_snappy": True,
         "with_zlib": True,
+        "with_deflate_backend": "zlib",
         "with_zstd": True,
         "with_icu": True,
         "srv": True,
@@ -59,6 +61,11 @@ class MongoCDriverConan(ConanFile):
             self.options.rm_safe("fPIC")
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
+        if not self.options.with_zlib:
+            self.options.rm_safe("with_deflate_backend")
+        elif self.options.with_deflate_backend == "zlib-ng":
+            # zlib built as a zlib-ng wrapper, in compat mode
+            self.options["zlib"].backend = "zlib-ng"
 
     def layout(self):
         cmake_layout(self, src_folder="src")
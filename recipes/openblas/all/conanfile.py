@@ -20,6 +20,10 @@ class OpenblasConan(ConanFile):
         "build_lapack": [True, False],
         "use_thread": [True, False],
         "dynamic_arch": [True, False],
+        "target": [None, "ANY"],
+        "num_threads": [None, "ANY"],
+        "use_openmp": [True, False],
+        "use_locking": [None, True, False],
     }
     default_options = {
         "shared": False,
@@ -27,6 +31,10 @@ class OpenblasConan(ConanFile):
         "build_lapack": False,
         "use_thread": True,
         "dynamic_arch": False,
+        "target": None,  # Detected from the build machine, e.g. HASWELL, SKYLAKEX, NEOVERSEN1
+        "num_threads": None,  # Number of cores of the build machine
+        "use_openmp": False,
+        "use_locking": None,  # Enabled when use_thread is disabled
     }
     generators = "cmake"
     short_paths = True
@@ -49,10 +57,37 @@ class OpenblasConan(ConanFile):
     def configure(self):
         if self.options.shared:
             del self.options.fPIC
+        if not self.options.use_thread:
+            del self.options.num_threads
+            del self.options.use_openmp
+
+    def package_id(self):
+        # Keep the package id of the builds using the default values of these options
+        if not self.options.target:
+            del self.info.options.target
+        if self.options.use_thread:
+            if not self.options.num_threads:
+                del self.info.options.num_threads
+            if not self.options.use_openmp:
+                del self.info.options.use_openmp
+        if self.options.use_locking == "None":
+            del self.info.options.use_locking
+
+    @property
+    def _use_locking(self):
+        if self.options.use_locking == "None":
+            # Required for safe concurrent calls to OpenBLAS routines
+            return not self.options.use_thread
+        return bool(self.options.use_locking)
 
     def validate(self):
         if hasattr(self, "settings_build") and tools.cross_building(self, skip_x64_x86=True):
             raise ConanInvalidConfiguration("Cross-building not implemented")
+        if self.options.get_safe("num_threads") and \
+           (not str(self.options.num_threads).isdigit() or int(str(self.options.num_threads)) < 1):
+            raise ConanInvalidConfiguration("openblas:num_threads must be a positive number")
+        if self.options.get_safe("use_openmp") and (self.settings.compiler in ["Visual Studio", "msvc", "apple-clang"]):
+            raise ConanInvalidConfiguration(f"openblas:use_openmp=True is not supported with {self.settings.compiler}")
 
     def source(self):
         tools.get(
@@ -71,9 +106,13 @@ class OpenblasConan(ConanFile):
         cmake.definitions["BUILD_WITHOUT_LAPACK"] = not self.options.build_lapack
         cmake.definitions["DYNAMIC_ARCH"] = self.options.dynamic_arch
         cmake.definitions["USE_THREAD"] = self.options.use_thread
-
-        # Required for safe concurrent calls to OpenBLAS routines
-        cmake.definitions["USE_LOCKING"] = not self.options.use_thread
+        cmake.definitions["USE_OPENMP"] = bool(self.options.get_safe("use_openmp", False))
+        cmake.definitions["USE_LOCKING"] = self._use_locking
+        if self.options.target:
+            # Kernels of this CPU only, or the oldest CPU supported with dynamic_arch
+            cmake.definitions["TARGET"] = str(self.options.target).upper()
+        if self.options.get_safe("num_threads"):
+            cmake.definitions["NUM_THREADS"] = self.options.num_threads
 
         cmake.definitions[
             "MSVC_STATIC_CRT"
@@ -123,11 +162,13 @@ endif()"""
         # CMake config file:
         # - OpenBLAS always has one and only one of these components: openmp, pthread or serial.
         # - Whatever if this component is requested or not, official CMake imported target is always OpenBLAS::OpenBLAS
-        # - TODO: add openmp component when implemented in this recipe
         self.cpp_info.set_property("cmake_file_name", "OpenBLAS")
         self.cpp_info.set_property("cmake_target_name", "OpenBLAS::OpenBLAS")
         self.cpp_info.set_property("pkg_config_name", "openblas")
-        cmake_component_name = "pthread" if self.options.use_thread else "serial" # TODO: ow to model this in CMakeDeps?
+        if self.options.get_safe("use_openmp"):
+            cmake_component_name = "openmp"
+        else:
+            cmake_component_name = "pthread" if self.options.use_thread else "serial" # TODO: ow to model this in CMakeDeps?
         self.cpp_info.components["openblas_component"].set_property("pkg_config_name", "openblas")
         self.cpp_info.components["openblas_component"].includedirs.append(
             os.path.join("include", "openblas")
@@ -139,6 +180,10 @@ endif()"""
                 self.cpp_info.components["openblas_component"].system_libs.append("pthread")
             if self.options.build_lapack:
                 self.cpp_info.components["openblas_component"].system_libs.append("gfortran")
+        if self.options.get_safe("use_openmp"):
+            # The OpenMP runtime of the compiler (libgomp, libomp...)
+            self.cpp_info.components["openblas_component"].sharedlinkflags.append("-fopenmp")
+            self.cpp_info.components["openblas_component"].exelinkflags.append("-fopenmp")
 
         self.output.info(
             "Setting OpenBLAS_HOME environment variable: {}".format(self.package_folder)
@@ -28,6 +28,7 @@ class OpenSSLConan(ConanFile):
         "386": [True, False],
         "capieng_dialog": [True, False],
         "enable_capieng": [True, False],
+        "enable_ktls": [True, False],
         "no_aria": [True, False],
         "no_asm": [True, False],
         "no_async": [True, False],
@@ -107,6 +108,10 @@ class OpenSSLConan(ConanFile):
         else:
             del self.options.fPIC
 
+        # Kernel TLS, used by SSL_sendfile(), is only offered on Linux
+        if self.settings.os != "Linux":
+            del self.options.enable_ktls
+
         if self.settings.os == "Emscripten":
             self.options.no_asm = True
             self.options.no_threads = True
@@ -136,6 +141,8 @@ class OpenSSLConan(ConanFile):
         if self.settings.os == "Emscripten":
             if not all((self.options.no_asm, self.options.no_threads, self.options.no_stdio)):
                 raise ConanInvalidConfiguration("os=Emscripten requires openssl:{no_asm,no_threads,no_stdio}=True")
+        if self.options.get_safe("enable_ktls") and self.options.no_sock:
+            raise ConanInvalidConfiguration("openssl:enable_ktls=True requires openssl:no_sock=False")
 
     @property
     def _is_clangcl(self):
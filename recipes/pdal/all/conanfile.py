@@ -25,6 +25,7 @@ class PdalConan(ConanFile):
         "with_lazperf": [True, False],
         "with_laszip": [True, False],
         "with_zlib": [True, False],
+        "with_deflate_backend": ["zlib", "zlib-ng"],
         "with_lzma": [True, False],
         "with_zstd": [True, False],
     }
@@ -36,6 +37,7 @@ class PdalConan(ConanFile):
         "with_lazperf": False, # TODO: should be True
         "with_laszip": True,
         "with_zlib": True,
+        "with_deflate_backend": "zlib",
         "with_lzma": False,
         "with_zstd": True,
     }
@@ -64,6 +66,11 @@ class PdalConan(ConanFile):
     def configure(self):
         if self.options.shared:
             del self.options.fPIC
+        if not self.options.with_zlib:
+            del self.options.with_deflate_backend
+        elif self.options.with_deflate_backend == "zlib-ng":
+            # zlib built as a zlib-ng wrapper, in compat mode
+            self.options["zlib"].backend = "zlib-ng"
 
     def requirements(self):
         # TODO package improvements:
@@ -30,6 +30,7 @@ class ProtobufConan(ConanFile):
         "with_rtti": [True, False],
         "lite": [True, False],
         "debug_suffix": [True, False],
+        "lto": [True, False],
     }
     default_options = {
         "shared": False,
@@ -38,6 +39,7 @@ class ProtobufConan(ConanFile):
         "with_rtti": True,
         "lite": False,
         "debug_suffix": True,
+        "lto": False,
     }
 
     short_paths = True
@@ -82,6 +84,11 @@ class ProtobufConan(ConanFile):
         if self.options.with_zlib:
             self.requires("zlib/1.2.13")
 
+    def package_id(self):
+        # Keep the package id of the builds without LTO
+        if not self.info.options.lto:
+            del self.info.options.lto
+
     def validate(self):
         if self.options.shared and str(self.settings.compiler.get_safe("runtime")) in ["MT", "MTd", "static"]:
             raise ConanInvalidConfiguration("Protobuf can't be built with shared + MT(d) runtimes")
@@ -128,6 +135,10 @@ class ProtobufConan(ConanFile):
             cmake.definitions["protobuf_MSVC_STATIC_RUNTIME"] = "MT" in runtime
         if Version(self.version) < "3.18.0" and self._is_clang_cl:
             cmake.definitions["CMAKE_RC_COMPILER"] = os.environ.get("RC", "llvm-rc")
+        if self.options.lto:
+            # cmake/CMakeLists.txt requires CMake 3.1.3, CMP0069=NEW makes libprotobuf, libprotoc and protoc honor IPO
+            cmake.definitions["CMAKE_POLICY_DEFAULT_CMP0069"] = "NEW"
+            cmake.definitions["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = True
         cmake.configure(build_folder=self._build_subfolder)
         return cmake
 
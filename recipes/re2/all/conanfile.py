@@ -19,10 +19,12 @@ class Re2Conan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "lto": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "lto": False,
     }
 
     def config_options(self):
@@ -33,6 +35,11 @@ class Re2Conan(ConanFile):
         if self.options.shared:
             self.options.rm_safe("fPIC")
 
+    def package_id(self):
+        # Keep the package id of the builds without LTO
+        if not self.info.options.lto:
+            del self.info.options.lto
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
@@ -49,6 +56,10 @@ class Re2Conan(ConanFile):
         tc.variables["RE2_BUILD_TESTING"] = False
         # Honor BUILD_SHARED_LIBS from conan_toolchain (see https://github.com/conan-io/conan/issues/11840)
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0077"] = "NEW"
+        if self.options.lto:
+            # The re2 releases packaged here require CMake 3.5.1 at most, set CMP0069 so the IPO variable is used
+            tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0069"] = "NEW"
+            tc.variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = True
         tc.generate()
 
     def build(self):
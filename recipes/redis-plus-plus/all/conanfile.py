@@ -23,12 +23,14 @@ class RedisPlusPlusConan(ConanFile):
         "fPIC": [True, False],
         "with_tls": [True, False],
         "build_async": [True, False],
+        "allocator": ["system", "jemalloc", "mimalloc"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "with_tls": False,
         "build_async": False,
+        "allocator": "system",
     }
 
     @property
@@ -62,6 +64,14 @@ class RedisPlusPlusConan(ConanFile):
                 del self.options.fPIC
             except Exception:
                 pass
+        if self.options.allocator == "mimalloc":
+            # Linked by the consumers, replaces malloc for the whole process
+            self.options["mimalloc"].override = True
+
+    def package_id(self):
+        # Keep the package id of the builds with the system allocator
+        if self.info.options.allocator == "system":
+            del self.info.options.allocator
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -70,6 +80,10 @@ class RedisPlusPlusConan(ConanFile):
         self.requires("hiredis/1.0.2")
         if self.options.get_safe("build_async"):
             self.requires("libuv/1.44.2")
+        if self.options.allocator == "jemalloc":
+            self.requires("jemalloc/5.3.0")
+        elif self.options.allocator == "mimalloc":
+            self.requires("mimalloc/2.0.7")
 
     def validate(self):
         if self.info.settings.compiler.get_safe("cppstd"):
@@ -140,6 +154,10 @@ class RedisPlusPlusConan(ConanFile):
             self.cpp_info.components["redis++lib"].requires.append("hiredis::hiredis_ssl")
         if self.options.get_safe("build_async"):
             self.cpp_info.components["redis++lib"].requires.append("libuv::libuv")
+        if self.options.allocator == "jemalloc":
+            self.cpp_info.components["redis++lib"].requires.append("jemalloc::jemalloc")
+        elif self.options.allocator == "mimalloc":
+            self.cpp_info.components["redis++lib"].requires.append("mimalloc::mimalloc")
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["redis++lib"].system_libs.append("pthread")
 
@@ -27,7 +27,9 @@ class RocksDB(ConanFile):
         "with_zlib": [True, False],
         "with_zstd": [True, False],
         "with_tbb": [True, False],
-        "with_jemalloc": [True, False],
+        "allocator": ["system", "jemalloc", "mimalloc"],
+        "with_jemalloc": [True, False, "deprecated"],
+        "with_liburing": [True, False],
         "enable_sse": [False, "sse42", "avx2"],
         "use_rtti": [True, False],
     }
@@ -41,7 +43,9 @@ class RocksDB(ConanFile):
         "with_zstd": False,
         "with_gflags": False,
         "with_tbb": False,
-        "with_jemalloc": False,
+        "allocator": "system",
+        "with_jemalloc": "deprecated",
+        "with_liburing": False,
         "enable_sse": False,
         "use_rtti": False,
     }
@@ -71,12 +75,31 @@ class RocksDB(ConanFile):
             del self.options.fPIC
         if self.settings.arch != "x86_64":
             del self.options.with_tbb
+        if self.settings.os != "Linux":
+            del self.options.with_liburing
         if self.settings.build_type == "Debug":
             self.options.use_rtti = True  # Rtti are used in asserts for debug mode...
 
     def configure(self):
         if self.options.shared:
             del self.options.fPIC
+        if self.options.with_jemalloc != "deprecated":
+            self.output.warn("with_jemalloc option is deprecated, use allocator option instead.")
+            if self.options.with_jemalloc:
+                self.options.allocator = "jemalloc"
+        del self.options.with_jemalloc
+        if self.options.allocator == "mimalloc":
+            # Linked by the consumers, replaces malloc for the whole process
+            self.options["mimalloc"].override = True
+
+    def package_id(self):
+        # Keep the package id of the builds without the options added later
+        if self.options.get_safe("with_liburing") == False:
+            del self.info.options.with_liburing
+        # Keep the package id of the builds made with the with_jemalloc option
+        if self.info.options.allocator in ["system", "jemalloc"]:
+            self.info.options.with_jemalloc = self.info.options.allocator == "jemalloc"
+            del self.info.options.allocator
 
     def requirements(self):
         if self.options.with_gflags:
@@ -91,8 +114,12 @@ class RocksDB(ConanFile):
             self.requires("zstd/1.5.2")
         if self.options.get_safe("with_tbb"):
             self.requires("onetbb/2020.3")
-        if self.options.with_jemalloc:
-            self.requires("jemalloc/5.2.1")
+        if self.options.allocator == "jemalloc":
+            self.requires("jemalloc/5.3.0")
+        elif self.options.allocator == "mimalloc":
+            self.requires("mimalloc/2.0.7")
+        if self.options.get_safe("with_liburing"):
+            self.requires("liburing/2.2")
 
     def validate(self):
         if self.settings.compiler.get_safe("cppstd"):
@@ -147,7 +174,11 @@ class RocksDB(ConanFile):
         self._cmake.definitions["WITH_ZLIB"] = self.options.with_zlib
         self._cmake.definitions["WITH_ZSTD"] = self.options.with_zstd
         self._cmake.definitions["WITH_TBB"] = self.options.get_safe("with_tbb", False)
-        self._cmake.definitions["WITH_JEMALLOC"] = self.options.with_jemalloc
+        self._cmake.definitions["WITH_JEMALLOC"] = self.options.allocator == "jemalloc"
+        if self.settings.os == "Linux":
+            # io_uring backed MultiGet and async reads, found by rocksdb's Finduring.cmake
+            # Always set, it is ON by default and would pick a liburing of the system
+            self._cmake.definitions["WITH_LIBURING"] = self.options.with_liburing
         self._cmake.definitions["ROCKSDB_BUILD_SHARED"] = self.options.shared
         self._cmake.definitions["ROCKSDB_LIBRARY_EXPORTS"] = self.settings.os == "Windows" and self.options.shared
         self._cmake.definitions["ROCKSDB_DLL" ] = self.settings.os == "Windows" and self.options.shared
@@ -237,5 +268,9 @@ class RocksDB(ConanFile):
             self.cpp_info.components["librocksdb"].requires.append("zstd::zstd")
         if self.options.get_safe("with_tbb"):
             self.cpp_info.components["librocksdb"].requires.append("onetbb::onetbb")
-        if self.options.with_jemalloc:
+        if self.options.allocator == "jemalloc":
             self.cpp_info.components["librocksdb"].requires.append("jemalloc::jemalloc")
+        elif self.options.allocator == "mimalloc":
+            self.cpp_info.components["librocksdb"].requires.append("mimalloc::mimalloc")
+        if self.options.get_safe("with_liburing"):
+            self.cpp_info.components["librocksdb"].requires.append("liburing::liburing")
@@ -21,10 +21,12 @@ class SnappyConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "simd_level": [None, "avx", "avx2"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "simd_level": None,
     }
 
     def export_sources(self):
@@ -34,11 +36,19 @@ class SnappyConan(ConanFile):
     def config_options(self):
         if self.settings.os == 'Windows':
             del self.options.fPIC
+        # AVX code paths can be required since 1.1.8, and only exist on x86
+        if Version(self.version) < "1.1.8" or self.settings.arch not in ["x86", "x86_64"]:
+            del self.options.simd_level
 
     def configure(self):
         if self.options.shared:
             del self.options.fPIC
 
+    def package_id(self):
+        # Keep the package id of the builds without simd_level
+        if not self.options.get_safe("simd_level", True):
+            del self.info.options.simd_level
+
     def validate(self):
         if self.info.settings.compiler.cppstd:
             check_min_cppstd(self, 11)
@@ -55,8 +65,12 @@ class SnappyConan(ConanFile):
         tc.variables["SNAPPY_BUILD_TESTS"] = False
         if Version(self.version) >= "1.1.8":
             tc.variables["SNAPPY_FUZZING_BUILD"] = False
-            tc.variables["SNAPPY_REQUIRE_AVX"] = False
-            tc.variables["SNAPPY_REQUIRE_AVX2"] = False
+            simd_level = self.options.get_safe("simd_level")
+            tc.variables["SNAPPY_REQUIRE_AVX"] = simd_level in ["avx", "avx2"]
+            tc.variables["SNAPPY_REQUIRE_AVX2"] = simd_level == "avx2"
+            if simd_level == "avx2":
+                # CPUs with AVX2 also have BMI2, but snappy only detects and uses its BMI2 decoding when built with -mbmi2
+                tc.extra_cxxflags.append("-mbmi2")
             tc.variables["SNAPPY_INSTALL"] = True
         if Version(self.version) >= "1.1.9":
             tc.variables["SNAPPY_BUILD_BENCHMARKS"] = False
@@ -25,6 +25,7 @@ class SpdlogConan(ConanFile):
         "wchar_support": [True, False],
         "wchar_filenames": [True, False],
         "no_exceptions": [True, False],
+        "lto": [True, False],
     }
     default_options = {
         "shared": False,
@@ -33,6 +34,7 @@ class SpdlogConan(ConanFile):
         "wchar_support": False,
         "wchar_filenames": False,
         "no_exceptions": False,
+        "lto": False,
     }
 
     def config_options(self):
@@ -44,6 +46,7 @@ class SpdlogConan(ConanFile):
             self.options.rm_safe("fPIC")
         if self.options.header_only:
             del self.options.shared
+            del self.options.lto
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -65,6 +68,9 @@ class SpdlogConan(ConanFile):
     def package_id(self):
         if self.options.header_only:
             self.info.clear()
+        elif not self.info.options.lto:
+            # Keep the package id of the builds without LTO
+            del self.info.options.lto
 
     @property
     def _info(self):
@@ -101,6 +107,10 @@ class SpdlogConan(ConanFile):
             if self.settings.os in ("iOS", "tvOS", "watchOS"):
                 tc.variables["SPDLOG_NO_TLS"] = True
             tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0091"] = "NEW"
+            if self.options.lto:
+                # Let CMake pick the LTO flags and archiver for libspdlog, CMP0069=NEW covers the releases requiring CMake < 3.9
+                tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0069"] = "NEW"
+                tc.variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = True
             tc.generate()
         cmake_deps = CMakeDeps(self)
         cmake_deps.generate()
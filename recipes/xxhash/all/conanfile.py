@@ -1,6 +1,8 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rmdir
+from conan.tools.microsoft import is_msvc
 import os
 
 required_conan_version = ">=1.53.0"
@@ -19,19 +21,37 @@ class XxHashConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "utility": [True, False],
+        "dispatch": [True, False],
+        "vector": [None, "scalar", "sse2", "avx2", "avx512", "neon"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "utility": True,
+        "dispatch": False,
+        "vector": None,
     }
 
+    @property
+    def _vector_values(self):
+        # XXH_VECTOR values of xxhash.h
+        return {"scalar": 0, "sse2": 1, "avx2": 2, "avx512": 3, "neon": 4}
+
+    @property
+    def _vector_flags(self):
+        if is_msvc(self):
+            return {"avx2": "/arch:AVX2", "avx512": "/arch:AVX512"}
+        return {"sse2": "-msse2", "avx2": "-mavx2", "avx512": "-mavx512f"}
+
     def export_sources(self):
+        copy(self, "CMakeLists.txt", src=self.recipe_folder, dst=self.export_sources_folder)
         export_conandata_patches(self)
 
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.arch not in ["x86", "x86_64"]:
+            del self.options.dispatch
 
     def configure(self):
         if self.options.shared:
@@ -39,9 +59,25 @@ class XxHashConan(ConanFile):
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
 
+    def package_id(self):
+        # Keep the package id of the builds using the default values of these options
+        if not self.options.get_safe("dispatch", True):
+            del self.info.options.dispatch
+        if not self.options.vector:
+            del self.info.options.vector
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def validate(self):
+        vector = self.info.options.vector
+        if self.info.options.get_safe("dispatch") and vector:
+            raise ConanInvalidConfiguration("The options 'dispatch' and 'vector' can't be used together")
+        if vector in ["sse2", "avx2", "avx512"] and self.info.settings.arch not in ["x86", "x86_64"]:
+            raise ConanInvalidConfiguration(f"vector={vector} requires an x86 architecture")
+        if vector == "neon" and not str(self.info.settings.arch).startswith(("armv7", "armv8")):
+            raise ConanInvalidConfiguration("vector=neon requires an ARM architecture")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version],
             destination=self.source_folder, strip_root=True)
@@ -50,6 +86,10 @@ class XxHashConan(ConanFile):
         tc = CMakeToolchain(self)
         tc.variables["XXHASH_BUNDLED_MODE"] = False
         tc.variables["XXHASH_BUILD_XXHSUM"] = self.options.utility
+        tc.variables["XXHASH_DISPATCH"] = self.options.get_safe("dispatch", False)
+        if self.options.vector:
+            tc.variables["XXHASH_VECTOR"] = self._vector_values[str(self.options.vector)]
+            tc.variables["XXHASH_VECTOR_FLAGS"] = self._vector_flags.get(str(self.options.vector), "")
         # Fix CMake configuration if target is iOS/tvOS/watchOS
         tc.cache_variables["CMAKE_MACOSX_BUNDLE"] = False
         # Generate a relocatable shared lib on Macos
@@ -59,13 +99,16 @@ class XxHashConan(ConanFile):
     def build(self):
         apply_conandata_patches(self)
         cmake = CMake(self)
-        cmake.configure(build_script_folder=os.path.join(self.source_folder, "cmake_unofficial"))
+        cmake.configure(build_script_folder=os.path.join(self.source_folder, os.pardir))
         cmake.build()
 
     def package(self):
         copy(self, "LICENSE", src=self.source_folder, dst=os.path.join(self.package_folder, "licenses"))
         cmake = CMake(self)
         cmake.install()
+        if self.options.get_safe("dispatch"):
+            # Including xxh_x86dispatch.h instead of xxhash.h redirects the XXH3 functions to their dispatched variant
+            copy(self, "xxh_x86dispatch.h", src=self.source_folder, dst=os.path.join(self.package_folder, "include"))
         rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
         rmdir(self, os.path.join(self.package_folder, "share"))
@@ -1,4 +1,5 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.files import apply_conandata_patches, export_conandata_patches, get, load, replace_in_file, save
 from conan.tools.scm import Version
@@ -21,16 +22,22 @@ class ZlibConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "backend": ["zlib", "zlib-ng"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "backend": "zlib",
     }
 
     @property
     def _is_mingw(self):
         return self.settings.os == "Windows" and self.settings.compiler == "gcc"
 
+    @property
+    def _is_zlib_ng(self):
+        return self.options.backend == "zlib-ng"
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -43,15 +50,39 @@ class ZlibConan(ConanFile):
             self.options.rm_safe("fPIC")
         self.settings.rm_safe("compiler.libcxx")
         self.settings.rm_safe("compiler.cppstd")
+        if self._is_zlib_ng:
+            # zlib-ng built with the zlib API and ABI, and its SIMD code paths selected at runtime
+            self.options["zlib-ng"].shared = self.options.shared
+            self.options["zlib-ng"].zlib_compat = True
+            self.options["zlib-ng"].with_gzfileop = True
+            self.options["zlib-ng"].with_optim = True
 
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def requirements(self):
+        if self._is_zlib_ng:
+            self.requires("zlib-ng/2.0.6")
+
+    def package_id(self):
+        if self._is_zlib_ng:
+            # The package only forwards to zlib-ng, it must change with it
+            self.info.requires["zlib-ng"].full_package_mode()
+        else:
+            # Keep the package id of the existing reference zlib binaries
+            del self.info.options.backend
+
+    def validate(self):
+        if self._is_zlib_ng and not self.dependencies["zlib-ng"].options.zlib_compat:
+            raise ConanInvalidConfiguration(f"{self.ref} with backend=zlib-ng requires zlib-ng:zlib_compat=True")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version],
             destination=self.source_folder, strip_root=True)
 
     def generate(self):
+        if self._is_zlib_ng:
+            return
         tc = CMakeToolchain(self)
         tc.variables["SKIP_INSTALL_ALL"] = False
         tc.variables["SKIP_INSTALL_LIBRARIES"] = False
@@ -79,6 +110,8 @@ class ZlibConan(ConanFile):
                                       '#if defined(HAVE_STDARG_H) && (1-HAVE_STDARG_H-1 != 0)')
 
     def build(self):
+        if self._is_zlib_ng:
+            return
         self._patch_sources()
         cmake = CMake(self)
         cmake.configure()
@@ -91,6 +124,8 @@ class ZlibConan(ConanFile):
 
     def package(self):
         save(self, os.path.join(self.package_folder, "licenses", "LICENSE"), self._extract_license())
+        if self._is_zlib_ng:
+            return
         cmake = CMake(self)
         cmake.install()
 
@@ -98,12 +133,20 @@ class ZlibConan(ConanFile):
         self.cpp_info.set_property("cmake_find_mode", "both")
         self.cpp_info.set_property("cmake_file_name", "ZLIB")
         self.cpp_info.set_property("cmake_target_name", "ZLIB::ZLIB")
-        self.cpp_info.set_property("pkg_config_name", "zlib")
-        if self.settings.os == "Windows" and not self._is_mingw:
-            libname = "zdll" if self.options.shared else "zlib"
+        if self._is_zlib_ng:
+            # Headers and libraries come from zlib-ng, consumers keep using the zlib CMake names and targets.
+            # zlib-ng already provides zlib.pc in compat mode, a wrapper with the same name would require itself
+            self.cpp_info.set_property("pkg_config_name", "zlib-wrapper")
+            self.cpp_info.requires = ["zlib-ng::zlib-ng"]
+            self.cpp_info.includedirs = []
+            self.cpp_info.libdirs = []
         else:
-            libname = "z"
-        self.cpp_info.libs = [libname]
+            self.cpp_info.set_property("pkg_config_name", "zlib")
+            if self.settings.os == "Windows" and not self._is_mingw:
+                libname = "zdll" if self.options.shared else "zlib"
+            else:
+                libname = "z"
+            self.cpp_info.libs = [libname]
 
         self.cpp_info.names["cmake_find_package"] = "ZLIB"
         self.cpp_info.names["cmake_find_package_multi"] = "ZLIB"
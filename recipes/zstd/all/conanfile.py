@@ -1,7 +1,10 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, collect_libs, copy, export_conandata_patches, get, replace_in_file, rmdir
+from conan.tools.files import apply_conandata_patches, collect_libs, copy, export_conandata_patches, get, replace_in_file, rm, rmdir
+from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
+import hashlib
 import os
 
 required_conan_version = ">=1.53.0"
@@ -20,25 +23,93 @@ class ZstdConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "threading": [True, False],
+        "legacy_support": [True, False],
+        "no_asm": [True, False],
+        "build_programs": [True, False],
+        "lto": [True, False],
+        "pgo": [None, "instrument", "optimize"],
+        "pgo_profile_sha256": [None, "ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "threading": True,
+        "legacy_support": True,
+        "no_asm": False,
+        "build_programs": False,
+        "lto": False,
+        "pgo": None,
+        "pgo_profile_sha256": None,
     }
 
+    @property
+    def _pgo_profile_dir(self):
+        # Machine-local folder of the profile, a conf so it stays out of the package id
+        return self.conf.get("user.pgo:profile_dir", check_type=str)
+
+    @property
+    def _pgo_flags(self):
+        """Compiler and linker flags of the current profile-guided optimization step"""
+        profile_dir = self._pgo_profile_dir.replace("\\", "/")
+        if self.options.pgo == "instrument":
+            flags = [f"-fprofile-generate={profile_dir}"]
+            if self.settings.compiler == "gcc":
+                # Thread-safe counters, and data files named relatively to the build folder which changes with the package id
+                flags.extend(["-fprofile-update=atomic", f"-fprofile-prefix-path={self.build_folder}"])
+            return flags, [f"-fprofile-generate={profile_dir}"]
+        if self.settings.compiler == "gcc":
+            return [f"-fprofile-use={profile_dir}", "-fprofile-partial-training", "-Wno-missing-profile",
+                    f"-fprofile-prefix-path={self.build_folder}"], []
+        return [f"-fprofile-use={profile_dir}/default.profdata"], []
+
     def export_sources(self):
         export_conandata_patches(self)
 
+    @property
+    def _has_huf_asm(self):
+        # x86-64 Huffman decoding assembly, not built by msvc
+        return Version(self.version) >= "1.5.1" and self.settings.arch == "x86_64" and not is_msvc(self)
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if not self._has_huf_asm:
+            del self.options.no_asm
 
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
+        if self.options.pgo != "optimize":
+            self.options.rm_safe("pgo_profile_sha256")
+
+    def package_id(self):
+        # Keep the package id of the builds without PGO
+        if not self.info.options.pgo:
+            del self.info.options.pgo
+        # Keep the package id of the builds without LTO
+        if not self.info.options.lto:
+            del self.info.options.lto
+        # Same for the default values of the options added later
+        if self.options.legacy_support:
+            del self.info.options.legacy_support
+        if not self.options.get_safe("no_asm", True):
+            del self.info.options.no_asm
+        if not self.options.build_programs:
+            del self.info.options.build_programs
+
+    def validate(self):
+        if self.options.pgo:
+            if self.settings.compiler not in ["gcc", "clang", "apple-clang"] or \
+               (self.settings.compiler == "gcc" and Version(self.settings.compiler.version) < "11"):
+                raise ConanInvalidConfiguration(f"{self.ref} pgo requires gcc >= 11, clang or apple-clang")
+            if self.options.pgo == "optimize" and not self.options.pgo_profile_sha256:
+                raise ConanInvalidConfiguration(f"{self.ref} pgo=optimize requires pgo_profile_sha256")
+
+    def validate_build(self):
+        if self.options.pgo and not self._pgo_profile_dir:
+            raise ConanInvalidConfiguration(f"{self.ref} pgo requires the user.pgo:profile_dir conf")
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -49,15 +120,45 @@ class ZstdConan(ConanFile):
 
     def generate(self):
         tc = CMakeToolchain(self)
-        tc.variables["ZSTD_BUILD_PROGRAMS"] = False
-        tc.variables["ZSTD_BUILD_STATIC"] = not self.options.shared
+        # The zstd CLI, multithreaded if threading is enabled
+        tc.variables["ZSTD_BUILD_PROGRAMS"] = self.options.build_programs
+        # The CLI links the static library, even in shared builds
+        tc.variables["ZSTD_BUILD_STATIC"] = not self.options.shared or self.options.build_programs
         tc.variables["ZSTD_BUILD_SHARED"] = self.options.shared
         tc.variables["ZSTD_MULTITHREAD_SUPPORT"] = self.options.threading
+        # Decoders of the formats older than v0.5, for a smaller library when disabled
+        tc.variables["ZSTD_LEGACY_SUPPORT"] = self.options.legacy_support
+        if self.options.get_safe("no_asm"):
+            # What ZSTD_NO_ASM=1 does with the Makefiles: huf_decompress_amd64.S becomes empty, the C decoder is used
+            tc.preprocessor_definitions["ZSTD_DISABLE_ASM"] = 1
         if Version(self.version) < "1.4.3":
             # Generate a relocatable shared lib on Macos
             tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0042"] = "NEW"
+        if self.options.lto:
+            # build/cmake declares an old cmake_minimum_required(), where CMP0069 would ignore the IPO variable
+            tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0069"] = "NEW"
+            tc.variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = True
+        if self.options.pgo:
+            cflags, ldflags = self._pgo_flags
+            tc.extra_cflags.extend(cflags)
+            tc.extra_sharedlinkflags.extend(ldflags)
+            tc.extra_exelinkflags.extend(ldflags)
         tc.generate()
 
+    def _check_pgo_profile(self):
+        # Same hash as tools/pgo_build.py: relative paths and content of every file of the folder
+        sha256 = hashlib.sha256()
+        profile_dir = self._pgo_profile_dir
+        for root, dirs, files in os.walk(profile_dir):
+            dirs.sort()
+            for filename in sorted(files):
+                path = os.path.join(root, filename)
+                sha256.update(os.path.relpath(path, profile_dir).replace("\\", "/").encode() + b"\0")
+                with open(path, "rb") as f:
+                    sha256.update(f.read())
+        if sha256.hexdigest() != str(self.options.pgo_profile_sha256).lower():
+            raise ConanInvalidConfiguration(f"The content of {profile_dir} doesn't match pgo_profile_sha256")
+
     def _patch_sources(self):
         apply_conandata_patches(self)
         # Don't force PIC
@@ -66,6 +167,8 @@ class ZstdConan(ConanFile):
                                   "POSITION_INDEPENDENT_CODE On", "")
 
     def build(self):
+        if self.options.pgo == "optimize":
+            self._check_pgo_profile()
         self._patch_sources()
         cmake = CMake(self)
         cmake.configure(build_script_folder=os.path.join(self.source_folder, "build", "cmake"))
@@ -77,6 +180,9 @@ class ZstdConan(ConanFile):
         cmake.install()
         rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+        if self.options.shared and self.options.build_programs:
+            rm(self, "*zstd_static*", os.path.join(self.package_folder, "lib"))
+            rm(self, "libzstd.a", os.path.join(self.package_folder, "lib"))
 
     def package_info(self):
         zstd_cmake = "libzstd_shared" if self.options.shared else "libzstd_static"
@@ -90,3 +196,7 @@ class ZstdConan(ConanFile):
         self.cpp_info.components["zstdlib"].libs = collect_libs(self)
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["zstdlib"].system_libs.append("pthread")
+        if self.options.build_programs:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info(f"Appending PATH env var with : {bin_path}")
+            self.env_info.PATH.append(bin_path)
@@ -0,0 +1,130 @@
+"""
+List the files and the recipes changed between two git revisions, without any GitHub service.
+
+Changed paths under recipes/ are mapped to their recipe folder, and config.yml is used to know
+which versions each folder builds. A change to a config.yml only targets the versions it adds or
+moves to another folder.
+
+    python3 tools/changed_recipes.py --base origin/master
+    python3 tools/changed_recipes.py --base origin/master --files "recipes/*/*/conanfile.py" --format files
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import subprocess
+import sys
+from pathlib import PurePosixPath
+
+import yaml
+
+
+def _git(*args):
+    return subprocess.run(["git", *args], capture_output=True, check=True, text=True).stdout
+
+
+def changed_files(base, head="HEAD", merge_base=True):
+    """Files added, copied, modified or renamed by 'head' compared to 'base'"""
+    revisions = f"{base}...{head}" if merge_base else f"{base}..{head}"
+    output = _git("diff", "--name-only", "--diff-filter=ACMR", "-z", revisions)
+    return [path for path in output.split("\0") if path]
+
+
+def filter_files(files, patterns):
+    """Keep the files matching any of the patterns, each path component matched separately like the
+    'pr_changed_files' action does, so '*' never crosses a '/'"""
+    if not patterns:
+        return list(files)
+    patterns = [PurePosixPath(pattern).parts for pattern in patterns]
+    result = []
+    for filename in files:
+        parts = PurePosixPath(filename).parts
+        for pattern in patterns:
+            if len(pattern) == len(parts) and all(fnmatch.fnmatch(parts[i], pattern[i]) for i in range(len(pattern))):
+                result.append(filename)
+                break
+    return result
+
+
+def _exists(revision, path):
+    return subprocess.run(["git", "cat-file", "-e", f"{revision}:{path}"], capture_output=True).returncode == 0
+
+
+def _config_versions(revision, recipe):
+    """Version -> folder of the config.yml of a recipe at a revision"""
+    path = f"recipes/{recipe}/config.yml"
+    try:
+        content = _git("show", f"{revision}:{path}")
+    except subprocess.CalledProcessError:
+        return {}
+    try:
+        config = yaml.safe_load(content) or {}
+    except yaml.YAMLError as error:
+        print(f"Ignoring {path} at {revision}: {error}", file=sys.stderr)
+        return {}
+    return {str(version): (info or {}).get("folder") for version, info in (config.get("versions") or {}).items()}
+
+
+def changed_recipes(files, base, head="HEAD"):
+    """Recipe folders targeted by the changed files, with the versions config.yml assigns to each of them"""
+    folders = {}
+    touched = set()
+    configs = set()
+    for filename in files:
+        parts = PurePosixPath(filename).parts
+        if len(parts) < 3 or parts[0] != "recipes":
+            continue
+        recipe = parts[1]
+        if parts[2] == "config.yml":
+            configs.add(recipe)
+        elif len(parts) > 3:
+            touched.add((recipe, parts[2]))
+
+    for recipe in {recipe for recipe, _ in touched} | configs:
+        new_versions = _config_versions(head, recipe)
+        old_versions = _config_versions(base, recipe) if recipe in configs else new_versions
+        for version, folder in new_versions.items():
+            # Every version built from a modified folder, plus the ones config.yml adds or moves
+            if (recipe, folder) in touched or old_versions.get(version) != folder:
+                folders.setdefault(recipe, {}).setdefault(folder, set()).add(version)
+
+    return [{"recipe": recipe, "folder": folder, "versions": sorted(versions)}
+            for recipe in sorted(folders) for folder, versions in sorted(folders[recipe].items())
+            # Folders deleted by the change, or not listed by config.yml, can't be built
+            if versions and _exists(head, f"recipes/{recipe}/{folder}/conanfile.py")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List the files and recipes changed between two git revisions.")
+    parser.add_argument("--base", required=True, help="revision to compare with (e.g. origin/master).")
+    parser.add_argument("--head", default="HEAD", help="revision with the changes.")
+    parser.add_argument("--no-merge-base", action="store_true",
+                        help="compare 'base' and 'head' directly instead of 'head' with its merge-base with 'base'.")
+    parser.add_argument("--files", action="append", default=[],
+                        help="only consider files matching this pattern (e.g. 'recipes/*/*/conanfile.py'), can be repeated.")
+    parser.add_argument("--format", choices=["recipes", "files", "json", "github"], default="recipes",
+                        help="'recipes' prints 'recipe/folder' lines, 'files' the changed files, 'json' both with the versions, "
+                             "'github' writes 'any_changed' and 'all_changed_files' to $GITHUB_OUTPUT.")
+    args = parser.parse_args()
+
+    files = filter_files(changed_files(args.base, args.head, not args.no_merge_base), args.files)
+
+    if args.format == "files":
+        for filename in files:
+            print(filename)
+    elif args.format == "github":
+        with open(os.environ["GITHUB_OUTPUT"], "a") as output_file:
+            output_file.write(f"any_changed={'true' if files else 'false'}\n")
+            output_file.write(f"all_changed_files={' '.join(files)}\n")
+    else:
+        recipes = changed_recipes(files, args.base, args.head)
+        if args.format == "json":
+            print(json.dumps({"files": files, "recipes": recipes}, indent=2))
+        else:
+            for target in recipes:
+                print(f"{target['recipe']}/{target['folder']}")
+
+
+if __name__ == "__main__":
+    main()
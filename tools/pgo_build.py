@@ -0,0 +1,129 @@
+"""
+Build a recipe with profile-guided optimization (PGO), for the recipes offering the 'pgo' options (zstd).
+
+The recipe is built three times over:
+
+  * an instrumented package (pgo=instrument), whose test_package is the first training run
+  * the optional workloads, run with the instrumented package in their environment
+  * the optimized package (pgo=optimize), built from the recorded profile
+
+Clang raw profiles are merged into default.profdata with llvm-profdata. The folder of the profile is
+given to the recipe with the 'user.pgo:profile_dir' conf, and its sha256 is an option of the optimized
+package, so its package id changes with the profile but not with where it is stored:
+
+    python3 tools/pgo_build.py zstd --workload "zstd -b1e3 corpus/*" -- -o zstd:build_programs=True
+    python3 tools/pgo_build.py zstd --version 1.5.2 --profile-dir /srv/pgo/zstd -- -pr:h clang -pr:b default
+
+cpython has its own PGO build, with -o cpython:optimizations=True and the training workload of
+-o cpython:profile_task.
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+
+import yaml
+from conans.model.version import Version
+
+
+def profile_sha256(profile_dir):
+    """Hash of the relative paths and content of the files of a folder, as recipes/zstd checks it"""
+    sha256 = hashlib.sha256()
+    for root, dirs, files in os.walk(profile_dir):
+        dirs.sort()
+        for filename in sorted(files):
+            path = os.path.join(root, filename)
+            sha256.update(os.path.relpath(path, profile_dir).replace("\\", "/").encode() + b"\0")
+            with open(path, "rb") as f:
+                sha256.update(f.read())
+    return sha256.hexdigest()
+
+
+def recipe_folder(recipes_root, recipe, version=None):
+    """(folder, version) of a version of a recipe, the latest one of config.yml by default"""
+    with open(os.path.join(recipes_root, recipe, "config.yml")) as f:
+        versions = {str(key): (value or {}).get("folder") for key, value in (yaml.safe_load(f)["versions"] or {}).items()}
+    if version is None:
+        version = max(versions, key=Version)
+    if version not in versions:
+        raise ValueError(f"{recipe}/{version} is not in config.yml")
+    return os.path.join(recipes_root, recipe, versions[version]), version
+
+
+def _run(command, **kwargs):
+    print(f"$ {' '.join(command) if isinstance(command, list) else command}", file=sys.stderr)
+    subprocess.run(command, check=True, **kwargs)
+
+
+def pgo_build(recipes_root, recipe, version, profile_dir, workloads, conan_args, llvm_profdata="llvm-profdata"):
+    """Create the instrumented and the optimized packages, returns the sha256 of the profile"""
+    folder, version = recipe_folder(recipes_root, recipe, version)
+    reference = f"{recipe}/{version}@"
+    profile_dir = os.path.abspath(profile_dir)
+    os.makedirs(profile_dir, exist_ok=True)
+    stale = [path for path in glob.glob(os.path.join(profile_dir, "**"), recursive=True) if os.path.isfile(path)]
+    if stale:
+        raise RuntimeError(f"{profile_dir} already contains profile data, remove it first")
+
+    profile_conf = ["-c", f"user.pgo:profile_dir={profile_dir}"]
+    # The instrumented libraries need the profiling runtime wherever they are linked
+    runtime_conf = ["-c", 'tools.build:sharedlinkflags=["-fprofile-generate"]',
+                    "-c", 'tools.build:exelinkflags=["-fprofile-generate"]']
+    instrument = ["-o", f"{recipe}:pgo=instrument", *profile_conf, *runtime_conf]
+    _run(["conan", "create", folder, reference, *instrument, *conan_args])
+
+    if workloads:
+        with tempfile.TemporaryDirectory() as install_folder:
+            _run(["conan", "install", reference, "-g", "VirtualRunEnv", "-if", install_folder, *instrument, *conan_args])
+            for workload in workloads:
+                _run(["bash", "-c", f". {os.path.join(install_folder, 'conanrun.sh')} && {workload}"])
+
+    raw_profiles = glob.glob(os.path.join(profile_dir, "*.profraw"))
+    if raw_profiles:
+        _run([llvm_profdata, "merge", f"-output={os.path.join(profile_dir, 'default.profdata')}", *raw_profiles])
+        for path in raw_profiles:
+            os.remove(path)
+    if not any(files for _, _, files in os.walk(profile_dir)):
+        raise RuntimeError(f"The training runs didn't write any profile data to {profile_dir}")
+
+    sha256 = profile_sha256(profile_dir)
+    _run(["conan", "create", folder, reference, "-o", f"{recipe}:pgo=optimize",
+          "-o", f"{recipe}:pgo_profile_sha256={sha256}", *profile_conf, *conan_args])
+    return sha256
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a recipe with profile-guided optimization.")
+    parser.add_argument("--recipes", default="recipes", help="folder containing the recipes.")
+    parser.add_argument("--version", help="version to build (the latest one of config.yml by default).")
+    parser.add_argument("--profile-dir", help="empty folder receiving the profile data (defaults to pgo/<recipe>-<version>).")
+    parser.add_argument("--workload", action="append", default=[],
+                        help="shell command run with the instrumented package in its environment, can be repeated.")
+    parser.add_argument("--llvm-profdata", default="llvm-profdata", help="llvm-profdata executable, for clang profiles.")
+    parser.add_argument("recipe", help="recipe folder name under recipes/.")
+    parser.add_argument("conan_args", nargs=argparse.REMAINDER,
+                        help="arguments given to every conan command after '--' (e.g. profiles, settings).")
+    args = parser.parse_args()
+
+    conan_args = args.conan_args[1:] if args.conan_args[:1] == ["--"] else args.conan_args
+    _, version = recipe_folder(args.recipes, args.recipe, args.version)
+    profile_dir = args.profile_dir or os.path.join("pgo", f"{args.recipe}-{version}")
+    try:
+        sha256 = pgo_build(args.recipes, args.recipe, version, profile_dir, args.workload, conan_args,
+                           args.llvm_profdata)
+    except (RuntimeError, subprocess.CalledProcessError) as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    print("[options]")
+    print(f"{args.recipe}:pgo=optimize")
+    print(f"{args.recipe}:pgo_profile_sha256={sha256}")
+    print("[conf]")
+    print(f"user.pgo:profile_dir={os.path.abspath(profile_dir)}")
+
+
+if __name__ == "__main__":
+    main()
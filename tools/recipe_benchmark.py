@@ -0,0 +1,218 @@
+"""
+Time how long the recipes take to be evaluated by Conan, and compare the timings with a baseline.
+
+Every recipe folder is loaded with Conan's own loader, but without any client, cache or remote:
+no dependency is resolved and nothing is downloaded. Each recipe is timed in four phases, with
+the latest version of its config.yml and a fixed Linux profile:
+
+  * load: import of conanfile.py (class definition time) and creation of the ConanFile object
+  * config_options
+  * configure: configure() and the validation of the resulting settings and options
+  * package_id
+
+    python3 tools/recipe_benchmark.py --output baseline.json
+    python3 tools/recipe_benchmark.py --baseline baseline.json boost qt
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import yaml
+from conans import __version__ as conan_version
+from conans.client.conf import get_default_settings_yml
+from conans.client.generators import GeneratorManager
+from conans.client.graph.python_requires import ConanPythonRequire
+from conans.client.loader import ConanFileLoader
+from conans.client.output import ConanOutput
+from conans.errors import ConanInvalidConfiguration
+from conans.model.info import ConanInfo
+from conans.model.profile import Profile
+from conans.model.ref import ConanFileReference
+from conans.model.settings import Settings
+from conans.model.version import Version
+
+
+PHASES = ["load", "config_options", "configure", "package_id"]
+PROFILE = {
+    "os": "Linux",
+    "arch": "x86_64",
+    "compiler": "gcc",
+    "compiler.version": "11",
+    "compiler.libcxx": "libstdc++11",
+    "build_type": "Release",
+}
+# A recipe regresses when a phase is both THRESHOLD times slower and MIN_DELTA_MS slower than the baseline
+THRESHOLD = 1.5
+MIN_DELTA_MS = 5.0
+
+
+def _profile():
+    profile = Profile()
+    profile.settings.update(PROFILE)
+    settings = Settings.loads(get_default_settings_yml())
+    settings.update_values(list(profile.settings.items()))
+    profile.processed_settings = settings
+    return profile
+
+
+def _version_key(version):
+    try:
+        return 1, Version(version)
+    except Exception:  # pylint: disable=broad-except
+        return 0, version
+
+
+def recipe_folders(recipes_root, recipes=None):
+    """(recipe, folder, version) of the given recipes (all of them by default), with the latest version of each folder"""
+    result = []
+    for recipe in sorted(recipes or os.listdir(recipes_root)):
+        recipe_path = os.path.join(recipes_root, recipe)
+        if not os.path.isdir(recipe_path):
+            print(f"Unknown recipe '{recipe}'", file=sys.stderr)
+            continue
+        versions = {}
+        config_path = os.path.join(recipe_path, "config.yml")
+        if os.path.isfile(config_path):
+            with open(config_path) as f:
+                config = yaml.safe_load(f) or {}
+            for version, info in (config.get("versions") or {}).items():
+                versions.setdefault((info or {}).get("folder"), []).append(str(version))
+        for folder in sorted(os.listdir(recipe_path)):
+            if not os.path.isfile(os.path.join(recipe_path, folder, "conanfile.py")):
+                continue
+            if folder not in versions:
+                # Folders config.yml doesn't list are not built
+                continue
+            result.append((recipe, folder, max(versions[folder], key=_version_key)))
+    return result
+
+
+def time_recipe(conanfile_path, name, version, profile, timings):
+    """Store in 'timings' the seconds spent by each phase, until one of them raises"""
+    # A new loader each time, it caches the imported classes
+    loader = ConanFileLoader(None, ConanOutput(io.StringIO()), ConanPythonRequire(None, None),
+                             generator_manager=GeneratorManager())
+    reference = ConanFileReference(name, version, None, None, validate=False)
+
+    start = time.perf_counter()
+    conanfile = loader.load_conanfile(os.path.abspath(conanfile_path), profile, reference)
+    conanfile.settings_build = profile.processed_settings.copy()
+    timings["load"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    conanfile.config_options()
+    timings["config_options"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    conanfile.options.propagate_upstream(None, None, None)
+    conanfile.configure()
+    conanfile.settings.validate()
+    conanfile.options.validate()
+    timings["configure"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    conanfile.info = ConanInfo.create(conanfile.settings.values, conanfile.options.values, [], [],
+                                      default_package_id_mode="semver_direct_mode", python_requires=None,
+                                      default_python_requires_id_mode="minor_mode")
+    conanfile.package_id()
+    conanfile.info.package_id()
+    timings["package_id"] = time.perf_counter() - start
+
+
+def run_benchmark(recipes_root, recipes=None, repeat=3):
+    """Per recipe folder, the median time in milliseconds of each phase over 'repeat' runs"""
+    profile = _profile()
+    results = {}
+    for recipe, folder, version in recipe_folders(recipes_root, recipes):
+        conanfile_path = os.path.join(recipes_root, recipe, folder, "conanfile.py")
+        runs = []
+        entry = {"version": version}
+        for _ in range(repeat):
+            timings = {}
+            try:
+                time_recipe(conanfile_path, recipe, version, profile, timings)
+            except ConanInvalidConfiguration as error:
+                # The fixed profile is not supported by the recipe, the phases before are still timed
+                entry["invalid"] = str(error).strip().splitlines()[0] if str(error).strip() else "invalid configuration"
+            except Exception as error:  # pylint: disable=broad-except
+                message = str(error).strip()
+                entry["error"] = f"{type(error).__name__}: {message.splitlines()[-1] if message else ''}"
+                break
+            runs.append(timings)
+        for phase in PHASES:
+            values = [run[phase] for run in runs if phase in run]
+            if values:
+                entry[phase] = round(statistics.median(values) * 1000, 3)
+        entry["total"] = round(sum(entry.get(phase, 0.0) for phase in PHASES), 3)
+        results[f"{recipe}/{folder}"] = entry
+    return results
+
+
+def compare(results, baseline, threshold=THRESHOLD, min_delta=MIN_DELTA_MS):
+    """(recipe, phase, baseline ms, current ms) of the phases slower than in the baseline"""
+    regressions = []
+    for recipe, entry in sorted(results.items()):
+        previous = baseline.get(recipe)
+        if not previous:
+            continue
+        for phase in PHASES + ["total"]:
+            before, after = previous.get(phase), entry.get(phase)
+            if before is None or after is None:
+                continue
+            if after > before * threshold and after - before > min_delta:
+                regressions.append((recipe, phase, before, after))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the evaluation of the recipes and detect regressions.")
+    parser.add_argument("--recipes", default="recipes", help="folder containing the recipes.")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per recipe, the median time is kept.")
+    parser.add_argument("--output", help="write the timings to this JSON file, to be used as a baseline.")
+    parser.add_argument("--baseline", help="JSON file of a previous run to compare with, exits with 1 on regressions.")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="ratio over the baseline for a phase to be a regression.")
+    parser.add_argument("--min-delta", type=float, default=MIN_DELTA_MS,
+                        help="milliseconds over the baseline for a phase to be a regression, to ignore noise.")
+    parser.add_argument("--top", type=int, default=20, help="number of slowest recipes to print.")
+    parser.add_argument("recipe", nargs="*", help="recipe folder names under recipes/ (all of them by default).")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.recipes, args.recipe, max(args.repeat, 1))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"python": platform.python_version(), "conan": conan_version, "profile": PROFILE,
+                       "recipes": results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    slowest = sorted(results.items(), key=lambda item: item[1]["total"], reverse=True)[:args.top]
+    print(f"{'recipe (ms)':40} " + " ".join(f"{phase:>14}" for phase in PHASES + ["total"]))
+    for recipe, entry in slowest:
+        print(f"{recipe:40} " + " ".join(f"{entry[phase]:>14.2f}" if phase in entry else f"{'-':>14}"
+                                         for phase in PHASES + ["total"]))
+    failed = {recipe: entry["error"] for recipe, entry in results.items() if "error" in entry}
+    for recipe, error in sorted(failed.items()):
+        print(f"{recipe}: {error}", file=sys.stderr)
+    print(f"{len(results)} recipe folders, {len(failed)} could not be evaluated, "
+          f"{sum(entry['total'] for entry in results.values()) / 1000:.2f}s in total", file=sys.stderr)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["recipes"]
+        regressions = compare(results, baseline, args.threshold, args.min_delta)
+        for recipe, phase, before, after in regressions:
+            print(f"Regression in {recipe} {phase}: {before:.2f}ms -> {after:.2f}ms", file=sys.stderr)
+        status = 1 if regressions else 0
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Dependency graph of the recipes, built from the requirements stored in the recipes metadata index.
+
+It answers "which recipes are affected by a change to X", following the requirements in reverse
+and transitively, and orders them in a build plan: a list of stages where every recipe only
+depends on recipes of earlier stages, so the recipes of a stage can be built in parallel.
+
+    python3 tools/recipe_graph.py affected zlib
+    python3 tools/recipe_graph.py plan openssl boost
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import defaultdict
+
+from recipe_index import DEFAULT_DATABASE, REQUIREMENT_KINDS, connect, update_index
+
+
+class RecipeGraph:
+    """
+       In-memory adjacency index of the recipes and the recipes they require
+    """
+
+    def __init__(self, edges):
+        # recipe -> recipes it requires, and the reverse
+        self.requires = defaultdict(set)
+        self.required_by = defaultdict(set)
+        for recipe, dependency in edges:
+            if recipe != dependency:
+                self.requires[recipe].add(dependency)
+                self.required_by[dependency].add(recipe)
+
+    @classmethod
+    def from_index(cls, db, kinds=None, conditional=True):
+        """Graph over the requirements of the given kinds, optionally skipping the conditional ones"""
+        kinds = kinds or REQUIREMENT_KINDS
+        # Requirements refer to package names, which may differ from the folder under recipes/
+        folders = {}
+        for recipe, name in db.execute("SELECT DISTINCT recipe, name FROM recipes"):
+            folders.setdefault(recipe, recipe)
+            if name:
+                folders.setdefault(name, recipe)
+        query = f"SELECT DISTINCT recipe, dependency FROM requirements WHERE kind IN ({', '.join('?' * len(kinds))})"
+        if not conditional:
+            query += " AND conditional = 0"
+        edges = [(recipe, folders.get(dependency, dependency)) for recipe, dependency in db.execute(query, kinds)]
+        return cls(edges)
+
+    def affected(self, recipes):
+        """Recipes requiring, directly or transitively, any of the given ones (which are included)"""
+        result = set()
+        pending = list(recipes)
+        while pending:
+            recipe = pending.pop()
+            if recipe in result:
+                continue
+            result.add(recipe)
+            pending.extend(self.required_by.get(recipe, ()))
+        return result
+
+    def build_plan(self, recipes):
+        """Stages of a topological order of the given recipes, cycles end up together in a last stage"""
+        recipes = set(recipes)
+        pending = {recipe: len(self.requires.get(recipe, set()) & recipes) for recipe in recipes}
+        stages = []
+        stage = sorted(recipe for recipe, count in pending.items() if count == 0)
+        while stage:
+            stages.append(stage)
+            following = set()
+            for recipe in stage:
+                del pending[recipe]
+                for dependent in self.required_by.get(recipe, ()):
+                    if dependent in pending:
+                        pending[dependent] -= 1
+                        if pending[dependent] == 0:
+                            following.add(dependent)
+            stage = sorted(following)
+        if pending:
+            print(f"Dependency cycle between: {', '.join(sorted(pending))}", file=sys.stderr)
+            stages.append(sorted(pending))
+        return stages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute the recipes affected by a change and their build order.")
+    parser.add_argument("--database", default=DEFAULT_DATABASE, help="SQLite file of the recipes metadata index.")
+    parser.add_argument("--recipes", default="recipes", help="folder containing the recipes.")
+    parser.add_argument("--kind", action="append", choices=REQUIREMENT_KINDS, dest="kinds",
+                        help="requirement kinds to follow, can be repeated (all of them by default).")
+    parser.add_argument("--no-conditional", action="store_true",
+                        help="ignore requirements declared under a condition (e.g. behind an option).")
+    parser.add_argument("command", choices=["affected", "plan"],
+                        help="'affected' lists the recipes to rebuild, 'plan' prints them as JSON build stages.")
+    parser.add_argument("recipe", nargs="+", help="changed recipes (folder names under recipes/).")
+    args = parser.parse_args()
+
+    db = connect(args.database)
+    update_index(db, args.recipes, os.cpu_count())
+    graph = RecipeGraph.from_index(db, args.kinds, conditional=not args.no_conditional)
+    db.close()
+
+    affected = graph.affected(args.recipe)
+    if args.command == "affected":
+        for recipe in sorted(affected):
+            print(recipe)
+    else:
+        print(json.dumps(graph.build_plan(affected), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+Build and query a SQLite index with the metadata of every recipe in the repository.
+
+The conanfile.py files are never imported: name, options, default_options, settings and
+requirements are read statically with the stdlib 'ast' module, and versions come from
+config.yml and conandata.yml. Updating the index only re-reads the recipe folders whose
+files changed since the previous update.
+
+    python3 tools/recipe_index.py update
+    python3 tools/recipe_index.py query "SELECT recipe FROM options WHERE option = 'simd'"
+    python3 tools/recipe_index.py query "SELECT DISTINCT recipe FROM requirements WHERE dependency = 'openssl'"
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import yaml
+
+
+DEFAULT_DATABASE = "recipes.sqlite"
+SCHEMA_VERSION = 1
+REQUIREMENT_KINDS = ["requires", "tool_requires", "build_requires", "test_requires"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (recipe TEXT, folder TEXT, sha256 TEXT, PRIMARY KEY (recipe, folder));
+CREATE TABLE IF NOT EXISTS recipes (
+    recipe TEXT, folder TEXT, name TEXT, class_name TEXT, package_type TEXT, license TEXT,
+    settings TEXT, PRIMARY KEY (recipe, folder));
+CREATE TABLE IF NOT EXISTS options (recipe TEXT, folder TEXT, option TEXT, "values" TEXT, "default" TEXT);
+CREATE TABLE IF NOT EXISTS requirements (
+    recipe TEXT, folder TEXT, kind TEXT, reference TEXT, dependency TEXT, version TEXT, conditional INTEGER);
+CREATE TABLE IF NOT EXISTS versions (recipe TEXT, version TEXT, folder TEXT, PRIMARY KEY (recipe, version));
+CREATE TABLE IF NOT EXISTS sources (recipe TEXT, folder TEXT, version TEXT, url TEXT, sha256 TEXT);
+CREATE INDEX IF NOT EXISTS options_option ON options (option);
+CREATE INDEX IF NOT EXISTS requirements_dependency ON requirements (dependency);
+"""
+FOLDER_TABLES = ["files", "recipes", "options", "requirements", "sources"]
+
+
+def _load_yaml(path):
+    if not os.path.isfile(path):
+        return None
+    with open(path) as f:
+        return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _literal(node, source):
+    """Python value of a literal node, or its source code when it is computed"""
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return ast.get_source_segment(source, node)
+
+
+def _string(node):
+    """Value of a string or f-string node, dynamic parts of an f-string are replaced with '*'"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        return "".join(value.value if isinstance(value, ast.Constant) else "*" for value in node.values)
+    return None
+
+
+def _strings(value):
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    if isinstance(value, (list, tuple)):
+        return [item for item in value if isinstance(item, str)]
+    return []
+
+
+def _is_conanfile(node):
+    for base in node.bases:
+        if isinstance(base, ast.Name) and base.id == "ConanFile":
+            return True
+        if isinstance(base, ast.Attribute) and base.attr == "ConanFile":
+            return True
+    return False
+
+
+def _parse_reference(reference):
+    """Split 'name/version@user/channel' into its name and version"""
+    name, _, version = reference.partition("@")[0].partition("/")
+    return name, version
+
+
+class _RequirementsVisitor(ast.NodeVisitor):
+    """
+       Collect self.requires(...), self.tool_requires(...), ... calls and whether they are conditional
+    """
+
+    def __init__(self):
+        self.requirements = []
+        self._conditions = 0
+
+    def _visit_conditional(self, node):
+        self._conditions += 1
+        self.generic_visit(node)
+        self._conditions -= 1
+
+    visit_If = visit_IfExp = visit_For = visit_While = visit_Try = _visit_conditional
+
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Attribute) and func.attr in REQUIREMENT_KINDS and \
+           isinstance(func.value, ast.Name) and func.value.id == "self" and node.args:
+            reference = _string(node.args[0])
+            if reference:
+                self.requirements.append((func.attr, reference, bool(self._conditions)))
+        self.generic_visit(node)
+
+
+def extract_conanfile(path):
+    """Static metadata of the ConanFile class of a conanfile.py"""
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    tree = ast.parse(source, path)
+
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    conanfile = next((node for node in classes if _is_conanfile(node)), None)
+    if conanfile is None:
+        # Recipes inheriting from a python_requires base class
+        conanfile = next((node for node in reversed(classes)), None)
+    if conanfile is None:
+        return None
+
+    attributes = {}
+    for node in conanfile.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            attributes[node.targets[0].id] = node.value
+
+    def attribute(name):
+        return _literal(attributes[name], source) if name in attributes else None
+
+    options = {}
+    if isinstance(attributes.get("options"), ast.Dict):
+        for key, value in zip(attributes["options"].keys, attributes["options"].values):
+            if key is not None:
+                options[_literal(key, source)] = {"values": _literal(value, source), "default": None}
+
+    default_options = attributes.get("default_options")
+    if isinstance(default_options, ast.Dict):
+        defaults = {_literal(key, source): _literal(value, source)
+                    for key, value in zip(default_options.keys, default_options.values) if key is not None}
+    else:
+        # Old style: "shared=False", "fPIC=True"
+        defaults = dict(item.split("=", 1) for item in _strings(attribute("default_options")) if "=" in item)
+    for option, default in defaults.items():
+        if isinstance(option, str) and ":" not in option:
+            options.setdefault(option, {"values": None, "default": None})["default"] = default
+
+    visitor = _RequirementsVisitor()
+    visitor.visit(conanfile)
+    requirements = visitor.requirements
+    for kind in REQUIREMENT_KINDS:
+        requirements += [(kind, reference, False) for reference in _strings(attribute(kind))]
+
+    name = attribute("name")
+    return {
+        "name": name if isinstance(name, str) else None,
+        "class_name": conanfile.name,
+        "package_type": attribute("package_type"),
+        "license": json.dumps(attribute("license")) if "license" in attributes else None,
+        "settings": _strings(attribute("settings")),
+        "options": options,
+        "requirements": requirements,
+    }
+
+
+def _folder_hash(folder_path):
+    hasher = hashlib.sha256()
+    for filename in ["conanfile.py", "conandata.yml"]:
+        path = os.path.join(folder_path, filename)
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                hasher.update(filename.encode())
+                hasher.update(f.read())
+    return hasher.hexdigest()
+
+
+def extract_folder(folder_path):
+    """Metadata of a recipe folder (e.g. recipes/zlib/all), reading conanfile.py and conandata.yml"""
+    try:
+        conanfile = extract_conanfile(os.path.join(folder_path, "conanfile.py"))
+    except (OSError, SyntaxError, ValueError) as error:
+        print(f"Skipping {folder_path}: {error}", file=sys.stderr)
+        conanfile = None
+    try:
+        conandata = _load_yaml(os.path.join(folder_path, "conandata.yml")) or {}
+    except yaml.YAMLError as error:
+        print(f"Ignoring the conandata.yml of {folder_path}: {error}", file=sys.stderr)
+        conandata = {}
+
+    sources = []
+    for version, source in (conandata.get("sources") or {}).items():
+        # Some recipes nest the sources per platform or per component, keep the first entry found
+        while isinstance(source, dict) and "url" not in source and source:
+            source = next(iter(source.values()))
+        while isinstance(source, list) and source:
+            source = source[0]
+        url, sha256 = None, None
+        if isinstance(source, dict):
+            url = source.get("url")
+            url = url[0] if isinstance(url, list) and url else url
+            sha256 = source.get("sha256")
+        sources.append((str(version), url if isinstance(url, str) else None, sha256))
+
+    return {"hash": _folder_hash(folder_path), "conanfile": conanfile, "sources": sources}
+
+
+def _recipe_folders(recipes_root):
+    for recipe in sorted(os.listdir(recipes_root)):
+        recipe_path = os.path.join(recipes_root, recipe)
+        if not os.path.isdir(recipe_path):
+            continue
+        for folder in sorted(os.listdir(recipe_path)):
+            if os.path.isfile(os.path.join(recipe_path, folder, "conanfile.py")):
+                yield recipe, folder
+
+
+def _extract(item):
+    recipes_root, recipe, folder = item
+    return recipe, folder, extract_folder(os.path.join(recipes_root, recipe, folder))
+
+
+def _delete_folder(db, recipe, folder):
+    for table in FOLDER_TABLES:
+        db.execute(f"DELETE FROM {table} WHERE recipe = ? AND folder = ?", (recipe, folder))
+
+
+def _insert_folder(db, recipe, folder, data):
+    _delete_folder(db, recipe, folder)
+    db.execute("INSERT INTO files VALUES (?, ?, ?)", (recipe, folder, data["hash"]))
+    db.executemany("INSERT INTO sources VALUES (?, ?, ?, ?, ?)",
+                   [(recipe, folder, version, url, sha256) for version, url, sha256 in data["sources"]])
+    conanfile = data["conanfile"]
+    if conanfile is None:
+        return
+    db.execute("INSERT INTO recipes VALUES (?, ?, ?, ?, ?, ?, ?)",
+               (recipe, folder, conanfile["name"], conanfile["class_name"], conanfile["package_type"],
+                conanfile["license"], json.dumps(conanfile["settings"])))
+    db.executemany("INSERT INTO options VALUES (?, ?, ?, ?, ?)",
+                   [(recipe, folder, str(option), json.dumps(values["values"]), json.dumps(values["default"]))
+                    for option, values in conanfile["options"].items()])
+    db.executemany("INSERT INTO requirements VALUES (?, ?, ?, ?, ?, ?, ?)",
+                   [(recipe, folder, kind, reference, *_parse_reference(reference), int(conditional))
+                    for kind, reference, conditional in conanfile["requirements"]])
+
+
+def connect(database=DEFAULT_DATABASE):
+    db = sqlite3.connect(database)
+    version = None
+    try:
+        version = db.execute("SELECT value FROM metadata WHERE key = 'schema'").fetchone()
+    except sqlite3.OperationalError:
+        pass
+    if version is not None and version[0] != str(SCHEMA_VERSION):
+        # Older layout: start again from an empty index
+        db.close()
+        os.remove(database)
+        db = sqlite3.connect(database)
+    db.executescript(SCHEMA)
+    db.execute("INSERT OR REPLACE INTO metadata VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+    return db
+
+
+def update_index(db, recipes_root="recipes", jobs=None):
+    """Re-read the recipe folders that changed since the previous update, returns how many were read"""
+    known = {(recipe, folder): sha256 for recipe, folder, sha256 in db.execute("SELECT * FROM files")}
+    current = list(_recipe_folders(recipes_root))
+
+    changed = [(recipes_root, recipe, folder) for recipe, folder in current
+               if known.get((recipe, folder)) != _folder_hash(os.path.join(recipes_root, recipe, folder))]
+    with db:
+        for recipe, folder in set(known) - set(current):
+            _delete_folder(db, recipe, folder)
+
+        if len(changed) > 1 and (jobs is None or jobs > 1):
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(_extract, changed, chunksize=16))
+        else:
+            results = list(map(_extract, changed))
+        for recipe, folder, data in results:
+            _insert_folder(db, recipe, folder, data)
+
+        # config.yml files are tiny, reading all of them is cheaper than tracking them
+        db.execute("DELETE FROM versions")
+        for recipe in sorted({recipe for recipe, _ in current}):
+            try:
+                config = _load_yaml(os.path.join(recipes_root, recipe, "config.yml")) or {}
+            except yaml.YAMLError as error:
+                print(f"Ignoring the config.yml of {recipe}: {error}", file=sys.stderr)
+                continue
+            db.executemany("INSERT OR REPLACE INTO versions VALUES (?, ?, ?)",
+                           [(recipe, str(version), (info or {}).get("folder"))
+                            for version, info in (config.get("versions") or {}).items()])
+    return len(changed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the index of recipes metadata.")
+    parser.add_argument("--database", default=DEFAULT_DATABASE, help="SQLite file of the index.")
+    parser.add_argument("--recipes", default="recipes", help="folder containing the recipes.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    update = subparsers.add_parser("update", help="create or refresh the index.")
+    update.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes used to read the recipes.")
+    query = subparsers.add_parser("query", help="run a SQL query over the index, printing JSON lines.")
+    query.add_argument("sql", help="query to execute, e.g. \"SELECT * FROM options WHERE option = 'simd'\"")
+    args = parser.parse_args()
+
+    db = connect(args.database)
+    if args.command == "update":
+        updated = update_index(db, args.recipes, args.jobs)
+        print(f"{updated} recipe folders updated in {args.database}", file=sys.stderr)
+    else:
+        cursor = db.execute(args.sql)
+        columns = [column[0] for column in cursor.description or []]
+        for row in cursor:
+            print(json.dumps(dict(zip(columns, row))))
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+Content-addressed cache of the source archives listed in the conandata.yml of the recipes.
+
+Archives are stored once per 'sha256' of conandata.yml, whatever recipe or URL they come from,
+and verified when downloaded. The cache also exposes the layout of Conan's download cache, so
+builders without network access only need to point Conan to it:
+
+    python3 tools/source_cache.py --cache /srv/sources fetch zlib openssl boost
+    echo "tools.files.download:download_cache=/srv/sources/conan" >> ~/.conan/global.conf
+
+Least recently used archives are removed first when the cache grows over '--max-size'.
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import yaml
+
+
+DEFAULT_CACHE = os.path.join(os.path.expanduser("~"), ".cci_sources")
+CHUNK_SIZE = 1024 * 1024
+
+
+def _sha256_text(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _conan_cache_key(url, sha256):
+    """Name of the archive in Conan's download cache, which ignores the query of the URL"""
+    url = urllib.parse.urlsplit(url)._replace(query="").geturl()
+    return _sha256_text(url + sha256)
+
+
+def _parse_size(value):
+    """'500M', '20G'... in bytes"""
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+    value = value.strip().upper().rstrip("B")
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def conandata_sources(conandata):
+    """(urls, sha256) of every archive of a conandata.yml, including per-platform or per-component ones"""
+    found = []
+
+    def visit(node):
+        if isinstance(node, dict):
+            if "url" in node and "sha256" in node:
+                urls = node["url"] if isinstance(node["url"], list) else [node["url"]]
+                found.append((tuple(str(url) for url in urls), str(node["sha256"]).lower()))
+            else:
+                for value in node.values():
+                    visit(value)
+        elif isinstance(node, list):
+            for value in node:
+                visit(value)
+
+    visit((conandata or {}).get("sources"))
+    return found
+
+
+def recipe_sources(recipes_root, recipes=None):
+    """Archives of the given recipes (all of them by default), without duplicates"""
+    sources = {}
+    for recipe in sorted(recipes or os.listdir(recipes_root)):
+        recipe_path = os.path.join(recipes_root, recipe)
+        if not os.path.isdir(recipe_path):
+            print(f"Unknown recipe '{recipe}'", file=sys.stderr)
+            continue
+        for folder in sorted(os.listdir(recipe_path)):
+            conandata_path = os.path.join(recipe_path, folder, "conandata.yml")
+            if not os.path.isfile(conandata_path):
+                continue
+            with open(conandata_path) as f:
+                try:
+                    conandata = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+                except yaml.YAMLError as error:
+                    print(f"Ignoring {conandata_path}: {error}", file=sys.stderr)
+                    continue
+            for urls, sha256 in conandata_sources(conandata):
+                known = sources.setdefault(sha256, [])
+                known.extend(url for url in urls if url not in known)
+    return sources
+
+
+class SourceCache:
+    """
+       Archives stored by sha256 under 'sha256/', hard-linked under 'conan/' with the names Conan's
+       download cache expects: sha256(url without its query + checksum)
+    """
+
+    def __init__(self, root=DEFAULT_CACHE):
+        self.root = root
+        self.blobs = os.path.join(root, "sha256")
+        self.conan = os.path.join(root, "conan")
+
+    def blob_path(self, sha256):
+        return os.path.join(self.blobs, sha256[:2], sha256)
+
+    def _link_conan(self, blob, urls, sha256):
+        os.makedirs(self.conan, exist_ok=True)
+        # Remember the URLs of each archive, to remove its Conan entries when it is evicted
+        urls_path = f"{blob}.urls"
+        known = []
+        if os.path.exists(urls_path):
+            with open(urls_path) as f:
+                known = f.read().splitlines()
+        for url in urls:
+            conan_path = os.path.join(self.conan, _conan_cache_key(url, sha256))
+            if not os.path.exists(conan_path):
+                try:
+                    os.link(blob, conan_path)
+                except OSError:
+                    # Hard links fail across filesystems, or when the filesystem has none
+                    tmp_path = f"{conan_path}.{os.getpid()}.part"
+                    shutil.copyfile(blob, tmp_path)
+                    os.replace(tmp_path, conan_path)
+        if any(url not in known for url in urls):
+            with open(urls_path, "w") as f:
+                f.write("\n".join(known + [url for url in urls if url not in known]) + "\n")
+
+    def _download(self, url, sha256, path):
+        tmp_path = f"{path}.{os.getpid()}.part"
+        hasher = hashlib.sha256()
+        try:
+            with urllib.request.urlopen(url, timeout=60) as response, open(tmp_path, "wb") as f:
+                for chunk in iter(lambda: response.read(CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+                    f.write(chunk)
+            if hasher.hexdigest() != sha256:
+                raise ValueError(f"sha256 mismatch, expected {sha256} but got {hasher.hexdigest()}")
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get(self, urls, sha256):
+        """Path of the archive, downloading it from the first working URL when it is not cached yet"""
+        sha256 = sha256.lower()
+        blob = self.blob_path(sha256)
+        if os.path.exists(blob):
+            # The modification time is the last use, used to evict the least recently used archives
+            os.utime(blob)
+        else:
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            errors = []
+            for url in urls:
+                try:
+                    self._download(url, sha256, blob)
+                    break
+                except Exception as error:  # pylint: disable=broad-except
+                    errors.append(f"{url}: {error}")
+            else:
+                raise RuntimeError(f"Could not download {sha256}: {'; '.join(errors)}")
+        self._link_conan(blob, urls, sha256)
+        return blob
+
+    def entries(self):
+        """(path, stat) of every archive in the cache"""
+        if not os.path.isdir(self.blobs):
+            return []
+        entries = []
+        for prefix in os.listdir(self.blobs):
+            for name in os.listdir(os.path.join(self.blobs, prefix)):
+                if not name.endswith((".part", ".urls")):
+                    path = os.path.join(self.blobs, prefix, name)
+                    entries.append((path, os.stat(path)))
+        return entries
+
+    def size(self):
+        return sum(stat.st_size for _, stat in self.entries())
+
+    def evict(self, max_size):
+        """Remove the least recently used archives until the cache is not larger than max_size bytes"""
+        entries = sorted(self.entries(), key=lambda entry: entry[1].st_mtime)
+        total = sum(stat.st_size for _, stat in entries)
+        removed = 0
+        for path, stat in entries:
+            if total <= max_size:
+                break
+            sha256 = os.path.basename(path)
+            urls_path = f"{path}.urls"
+            if os.path.exists(urls_path):
+                with open(urls_path) as f:
+                    for url in f.read().splitlines():
+                        conan_path = os.path.join(self.conan, _conan_cache_key(url, sha256))
+                        if os.path.exists(conan_path):
+                            os.remove(conan_path)
+                os.remove(urls_path)
+            os.remove(path)
+            total -= stat.st_size
+            removed += 1
+        return removed
+
+    def fetch(self, sources, jobs=8):
+        """Download in parallel the missing archives of {sha256: urls}, returns the failures"""
+        def fetch_one(item):
+            sha256, urls = item
+            try:
+                self.get(urls, sha256)
+            except RuntimeError as error:
+                return str(error)
+            except OSError as error:
+                # Cache folder not writable, disk full...
+                return f"Could not store {sha256}: {error}"
+            return None
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            return [error for error in executor.map(fetch_one, sorted(sources.items())) if error]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content-addressed cache of the recipes source archives.")
+    parser.add_argument("--cache", default=os.environ.get("CCI_SOURCE_CACHE", DEFAULT_CACHE),
+                        help="cache folder (defaults to $CCI_SOURCE_CACHE or ~/.cci_sources).")
+    parser.add_argument("--recipes", default="recipes", help="folder containing the recipes.")
+    parser.add_argument("--max-size", type=_parse_size,
+                        help="evict least recently used archives above this size (e.g. 50G).")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    fetch = subparsers.add_parser("fetch", help="download the archives of some recipes (all of them by default).")
+    fetch.add_argument("recipe", nargs="*", help="recipe folder names under recipes/.")
+    fetch.add_argument("-j", "--jobs", type=int, default=8, help="number of parallel downloads.")
+    subparsers.add_parser("evict", help="apply --max-size.")
+    subparsers.add_parser("stats", help="print the number of archives and the size of the cache.")
+    args = parser.parse_args()
+
+    cache = SourceCache(args.cache)
+    status = 0
+    if args.command == "fetch":
+        sources = recipe_sources(args.recipes, args.recipe)
+        errors = cache.fetch(sources, args.jobs)
+        for error in errors:
+            print(error, file=sys.stderr)
+        print(f"{len(sources) - len(errors)} archives available, {len(errors)} failed", file=sys.stderr)
+        status = 1 if errors else 0
+    if args.max_size is not None:
+        removed = cache.evict(args.max_size)
+        print(f"{removed} archives evicted", file=sys.stderr)
+    if args.command == "stats":
+        print(f"{len(cache.entries())} archives, {cache.size() / 1024 ** 2:.1f} MiB in {cache.root}")
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()